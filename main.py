@@ -194,6 +194,10 @@ def cli_main():
 
 
 if __name__ == "__main__":
+    # Required for process pools in frozen (PyInstaller) builds
+    import multiprocessing
+    multiprocessing.freeze_support()
+
     # Check for CLI mode
     if "--cli" in sys.argv:
         cli_main()
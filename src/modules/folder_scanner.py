@@ -4,26 +4,46 @@ Creates comprehensive directory trees with file contents.
 """
 
 import os
+import time
+from collections import deque
+from fnmatch import fnmatchcase
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Callable
+from typing import Any, Dict, List, Optional, Set, Tuple, Callable
 from concurrent.futures import ThreadPoolExecutor
 
 
+def _file_extension(name: str) -> str:
+    """
+    Return the lowercased extension of a file name, including the dot.
+
+    Equivalent to os.path.splitext(name)[1].lower() (leading dots do not start
+    an extension) but done with a single rpartition call.
+    """
+    head, dot, tail = name.rpartition('.')
+    return dot + tail.lower() if head.lstrip('.') else ''
+
+
 @dataclass
 class FileEntry:
     """Information about a file in the scan."""
     path: str
     name: str
     size: int
-    modified: datetime
+    modified: float  # st_mtime, converted lazily by modified_dt
     extension: str
     is_binary: bool = False
+    size_str: str = ""
     content: Optional[str] = None
     encoding: str = "utf-8"
     error: Optional[str] = None
 
+    @property
+    def modified_dt(self) -> datetime:
+        """Modification time as a datetime."""
+        return datetime.fromtimestamp(self.modified)
+
 
 @dataclass
 class DirectoryEntry:
@@ -69,13 +89,13 @@ class FolderScanner:
         '.pdf', '.doc', '.docx', '.xls', '.xlsx'
     }
 
-    BINARY_EXTENSIONS = {
+    BINARY_EXTENSIONS = frozenset({
         '.exe', '.dll', '.so', '.dylib', '.o', '.obj',
         '.pyc', '.pyo', '.pyd', '.class',
         '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.ico',
         '.mp3', '.mp4', '.avi', '.mov', '.wav',
         '.zip', '.tar', '.gz', '.rar', '.7z', '.pdf'
-    }
+    })
 
     def __init__(self):
         self.excluded_dirs: Set[str] = self.DEFAULT_EXCLUDED_DIRS.copy()
@@ -83,8 +103,10 @@ class FolderScanner:
         self.max_file_size: int = 1024 * 1024  # 1MB
         self.include_content: bool = True
         self.include_binary: bool = False
+        self.max_read_workers: int = 8
         self.on_progress: Optional[Callable[[str], None]] = None
         self._should_stop = False
+        self._compile_exclusions()
 
     def configure(self,
                   excluded_dirs: Optional[Set[str]] = None,
@@ -100,6 +122,14 @@ class FolderScanner:
         self.max_file_size = max_file_size
         self.include_content = include_content
         self.include_binary = include_binary
+        self._compile_exclusions()
+
+    def _compile_exclusions(self) -> None:
+        """Split exclusion sets into exact-match frozensets and glob patterns."""
+        self._excluded_dirs_fs = frozenset(d for d in self.excluded_dirs if '*' not in d)
+        self._glob_dirs = [d for d in self.excluded_dirs if '*' in d]
+        self._excluded_ext_fs = frozenset(e for e in self.excluded_extensions if '*' not in e)
+        self._glob_exts = [e for e in self.excluded_extensions if '*' in e]
 
     def stop(self) -> None:
         """Stop the current scan."""
@@ -116,6 +146,7 @@ class FolderScanner:
             ScanResult with complete directory structure
         """
         self._should_stop = False
+        self._compile_exclusions()
         start_time = datetime.now()
 
         result = ScanResult(root_path=directory)
@@ -129,7 +160,10 @@ class FolderScanner:
             return result
 
         try:
-            result.root_entry = self._scan_directory(directory, result)
+            pending_reads: List[Tuple[int, FileEntry]] = []
+            result.root_entry = self._scan_directory(directory, result, pending_reads)
+            if pending_reads and not self._should_stop:
+                self._read_contents(pending_reads)
             if result.root_entry:
                 result.total_files = self._count_files(result.root_entry)
                 result.total_directories = self._count_directories(result.root_entry)
@@ -140,79 +174,90 @@ class FolderScanner:
         result.scan_time = (datetime.now() - start_time).total_seconds()
         return result
 
-    def _scan_directory(self, path: str, result: ScanResult) -> Optional[DirectoryEntry]:
-        """Recursively scan a directory."""
-        if self._should_stop:
-            return None
-
-        name = os.path.basename(path) or path
-
-        if self.on_progress:
-            self.on_progress(f"Scanning: {path}")
-
-        entry = DirectoryEntry(path=path, name=name)
-
-        try:
-            items = sorted(os.listdir(path))
-        except PermissionError:
-            result.errors.append(f"Permission denied: {path}")
-            return entry
-        except Exception as e:
-            result.errors.append(f"Error reading {path}: {str(e)}")
-            return entry
-
-        # Separate directories and files
-        dirs = []
-        files = []
-
-        for item in items:
-            if self._should_stop:
-                break
+    def _scan_directory(self, path: str, result: ScanResult,
+                        pending_reads: Optional[List[Tuple[int, FileEntry]]] = None) -> Optional[DirectoryEntry]:
+        """
+        Scan a directory tree with os.walk, pruning excluded directories.
 
-            item_path = os.path.join(path, item)
+        Symbolic links to directories are not followed, and are left out of
+        the tree rather than shown as empty folders.
 
-            if os.path.isdir(item_path):
-                if item not in self.excluded_dirs:
-                    dirs.append(item)
-            elif os.path.isfile(item_path):
-                ext = os.path.splitext(item)[1].lower()
-                if ext not in self.excluded_extensions:
-                    files.append(item)
+        When pending_reads is given, file contents are not read during the walk;
+        (inode, entry) pairs are queued instead for _read_contents.
+        """
+        if self._should_stop:
+            return None
 
-        # Process subdirectories
-        for dir_name in dirs:
+        root_entry = DirectoryEntry(path=path, name=os.path.basename(path) or path)
+        entries: Dict[str, DirectoryEntry] = {path: root_entry}
+
+        def on_error(error: OSError) -> None:
+            if isinstance(error, PermissionError):
+                result.errors.append(f"Permission denied: {error.filename}")
+            else:
+                result.errors.append(f"Error reading {error.filename}: {str(error)}")
+
+        # Hoist attribute and global lookups out of the hot loop
+        excl_dirs = self._excluded_dirs_fs
+        glob_dirs = self._glob_dirs
+        excl_exts = self._excluded_ext_fs
+        glob_exts = self._glob_exts
+        on_progress = self.on_progress
+        scan_file = self._scan_file
+        file_extension = _file_extension
+        join = os.path.join
+        islink = os.path.islink
+
+        for root, dirs, files in os.walk(path, topdown=True, onerror=on_error, followlinks=False):
             if self._should_stop:
                 break
-            dir_path = os.path.join(path, dir_name)
-            subdir = self._scan_directory(dir_path, result)
-            if subdir:
-                entry.subdirectories.append(subdir)
 
-        # Process files
-        for file_name in files:
-            if self._should_stop:
-                break
-            file_path = os.path.join(path, file_name)
-            file_entry = self._scan_file(file_path)
-            entry.files.append(file_entry)
+            if on_progress:
+                on_progress(f"Scanning: {root}")
 
-        return entry
+            entry = entries[root]
+            subdirectories = entry.subdirectories
+            entry_files = entry.files
 
-    def _scan_file(self, path: str) -> FileEntry:
-        """Scan a single file."""
+            # Prune excluded and symlinked directories in place so os.walk
+            # skips them
+            dirs[:] = sorted(
+                d for d in dirs
+                if d not in excl_dirs and not (glob_dirs and any(fnmatchcase(d, g) for g in glob_dirs))
+                and not islink(join(root, d))
+            )
+            for dir_name in dirs:
+                dir_path = join(root, dir_name)
+                subdir = DirectoryEntry(path=dir_path, name=dir_name)
+                subdirectories.append(subdir)
+                entries[dir_path] = subdir
+
+            for file_name in sorted(files):
+                if self._should_stop:
+                    break
+                ext = file_extension(file_name)
+                if ext in excl_exts or (glob_exts and any(fnmatchcase(ext, g) for g in glob_exts)):
+                    continue
+                entry_files.append(scan_file(join(root, file_name), pending_reads))
+
+        return root_entry
+
+    def _scan_file(self, path: str,
+                   pending_reads: Optional[List[Tuple[int, FileEntry]]] = None) -> FileEntry:
+        """Scan a single file, reading its content now or queuing it in pending_reads."""
         name = os.path.basename(path)
-        ext = os.path.splitext(name)[1].lower()
+        ext = _file_extension(name)
 
         try:
             stats = os.stat(path)
             size = stats.st_size
-            modified = datetime.fromtimestamp(stats.st_mtime)
+            modified = stats.st_mtime
         except Exception as e:
             return FileEntry(
                 path=path,
                 name=name,
                 size=0,
-                modified=datetime.now(),
+                modified=time.time(),
                 extension=ext,
                 error=str(e)
             )
@@ -225,26 +270,48 @@ class FolderScanner:
             size=size,
             modified=modified,
             extension=ext,
-            is_binary=is_binary
+            is_binary=is_binary,
+            size_str=self._format_size(size)
         )
 
         # Read content if requested
         if self.include_content and size <= self.max_file_size:
             if not is_binary or self.include_binary:
-                content, encoding, error = self._read_file(path, is_binary)
-                entry.content = content
-                entry.encoding = encoding
-                entry.error = error
+                if pending_reads is not None:
+                    pending_reads.append((stats.st_ino, entry))
+                else:
+                    self._apply_content(entry, self._read_file(path, is_binary))
 
         return entry
 
+    def _apply_content(self, entry: FileEntry, read_result: tuple) -> None:
+        """Store the (content, encoding, error) tuple from _read_file on an entry."""
+        entry.content, entry.encoding, entry.error = read_result
+
+    def _read_contents(self, pending_reads: List[Tuple[int, FileEntry]]) -> None:
+        """
+        Read queued file contents in a thread pool.
+
+        Files are read in inode order, a cheap proxy for on-disk layout that
+        keeps reads closer to sequential on spinning disks.
+        """
+        entries = [entry for _, entry in sorted(pending_reads, key=lambda item: item[0])]
+
+        if self.on_progress:
+            self.on_progress(f"Reading {len(entries)} files...")
+
+        with ThreadPoolExecutor(max_workers=self.max_read_workers) as executor:
+            read_results = executor.map(lambda e: self._read_file(e.path, e.is_binary), entries)
+            for entry, read_result in zip(entries, read_results, strict=True):
+                self._apply_content(entry, read_result)
+
     def _read_file(self, path: str, is_binary: bool) -> tuple:
         """Read file content with encoding detection."""
         if is_binary:
             try:
                 with open(path, 'rb') as f:
                     data = f.read(1024)  # First 1KB only
-                hex_dump = ' '.join(f'{b:02x}' for b in data)
+                hex_dump = data.hex(' ')
                 return f"[Binary content - {len(data)} bytes shown]\n{hex_dump}", "binary", None
             except Exception as e:
                 return None, "binary", str(e)
@@ -263,58 +330,65 @@ class FolderScanner:
 
         return None, "unknown", "Unable to decode file"
 
+    def _iter_directories(self, entry: DirectoryEntry):
+        """Yield a directory entry and all of its descendants without recursion."""
+        stack = [entry]
+        while stack:
+            current = stack.pop()
+            yield current
+            stack.extend(current.subdirectories)
+
     def _count_files(self, entry: DirectoryEntry) -> int:
         """Count total files in a directory entry."""
-        count = len(entry.files)
-        for subdir in entry.subdirectories:
-            count += self._count_files(subdir)
-        return count
+        return sum(len(d.files) for d in self._iter_directories(entry))
 
     def _count_directories(self, entry: DirectoryEntry) -> int:
         """Count total directories in a directory entry."""
-        count = len(entry.subdirectories)
-        for subdir in entry.subdirectories:
-            count += self._count_directories(subdir)
-        return count
+        return sum(len(d.subdirectories) for d in self._iter_directories(entry))
 
     def _calculate_size(self, entry: DirectoryEntry) -> int:
         """Calculate total size of a directory entry."""
-        size = sum(f.size for f in entry.files)
-        for subdir in entry.subdirectories:
-            size += self._calculate_size(subdir)
-        return size
+        return sum(f.size for d in self._iter_directories(entry) for f in d.files)
 
     def generate_tree(self, result: ScanResult, include_files: bool = True) -> str:
         """Generate a text tree representation."""
         if not result.root_entry:
             return "No data"
 
-        lines = []
-        self._generate_tree_lines(result.root_entry, lines, "", True, include_files)
-        return "\n".join(lines)
+        return "\n".join(self._iter_tree_lines(result.root_entry, include_files))
+
+    def write_tree(self, f, result: ScanResult, include_files: bool = True) -> None:
+        """Write the text tree directly to an open file without building it in memory."""
+        if not result.root_entry:
+            f.write("No data\n")
+            return
 
-    def _generate_tree_lines(self, entry: DirectoryEntry, lines: List[str],
-                             prefix: str, is_last: bool, include_files: bool) -> None:
-        """Generate tree lines recursively."""
-        connector = "└── " if is_last else "├── "
-        lines.append(f"{prefix}{connector}{entry.name}/")
+        f.writelines(f"{line}\n" for line in self._iter_tree_lines(result.root_entry, include_files))
 
-        new_prefix = prefix + ("    " if is_last else "│   ")
+    def _iter_tree_lines(self, entry: DirectoryEntry, include_files: bool = True):
+        """Yield tree lines using an explicit stack (no recursion)."""
+        stack = deque([(entry, "", True)])
+
+        while stack:
+            item, item_prefix, item_is_last = stack.pop()
+            connector = "└── " if item_is_last else "├── "
+
+            if isinstance(item, FileEntry):
+                size_str = item.size_str or self._format_size(item.size)
+                yield f"{item_prefix}{connector}{item.name} ({size_str})"
+                continue
 
-        # Process subdirectories
-        items = list(entry.subdirectories)
-        if include_files:
-            items.extend(entry.files)
+            yield f"{item_prefix}{connector}{item.name}/"
+            child_prefix = item_prefix + ("    " if item_is_last else "│   ")
 
-        for i, item in enumerate(items):
-            is_item_last = (i == len(items) - 1)
+            children = list(item.subdirectories)
+            if include_files:
+                children.extend(item.files)
 
-            if isinstance(item, DirectoryEntry):
-                self._generate_tree_lines(item, lines, new_prefix, is_item_last, include_files)
-            elif isinstance(item, FileEntry):
-                item_connector = "└── " if is_item_last else "├── "
-                size_str = self._format_size(item.size)
-                lines.append(f"{new_prefix}{item_connector}{item.name} ({size_str})")
+            # Push in reverse so children are popped in their original order
+            last_index = len(children) - 1
+            for i in range(last_index, -1, -1):
+                stack.append((children[i], child_prefix, i == last_index))
 
     def _format_size(self, size: int) -> str:
         """Format size to human-readable string."""
@@ -327,7 +401,7 @@ class FolderScanner:
     def export_to_file(self, result: ScanResult, output_path: str,
                        include_content: bool = True) -> None:
         """Export scan result to a text file."""
-        with open(output_path, 'w', encoding='utf-8') as f:
+        with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
             f.write('\ufeff')  # BOM for UTF-8
             f.write(f"DIRECTORY SCAN REPORT\n")
             f.write(f"{'=' * 80}\n")
@@ -342,8 +416,8 @@ class FolderScanner:
             # Directory tree
             f.write("DIRECTORY STRUCTURE:\n")
             f.write("-" * 40 + "\n")
-            f.write(self.generate_tree(result))
-            f.write("\n\n")
+            self.write_tree(f, result)
+            f.write("\n")
 
             # File contents
             if include_content and result.root_entry:
@@ -362,18 +436,25 @@ class FolderScanner:
 
     def _write_contents(self, f, entry: DirectoryEntry) -> None:
         """Write file contents to output."""
-        for file_entry in entry.files:
-            if file_entry.content:
-                f.write(f"\n{'#' * 80}\n")
-                f.write(f"# FILE: {file_entry.path}\n")
-                f.write(f"# Size: {self._format_size(file_entry.size)}\n")
-                f.write(f"# Encoding: {file_entry.encoding}\n")
-                f.write(f"{'#' * 80}\n\n")
-                f.write(file_entry.content)
-                f.write("\n\n")
-
-        for subdir in entry.subdirectories:
-            self._write_contents(f, subdir)
+        stack = deque([entry])
+
+        while stack:
+            current = stack.pop()
+            parts = []
+            for file_entry in current.files:
+                if file_entry.content:
+                    parts.append(f"\n{'#' * 80}\n")
+                    parts.append(f"# FILE: {file_entry.path}\n")
+                    parts.append(f"# Size: {file_entry.size_str or self._format_size(file_entry.size)}\n")
+                    parts.append(f"# Encoding: {file_entry.encoding}\n")
+                    parts.append(f"{'#' * 80}\n\n")
+                    parts.append(file_entry.content)
+                    parts.append("\n\n")
+            if parts:
+                f.write("".join(parts))
+
+            # Reverse so subdirectories are written in their original order
+            stack.extend(reversed(current.subdirectories))
 
     def get_all_files_flat(self, entry: DirectoryEntry, root_path: str = "") -> List[Dict]:
         """Get all files as a flat list of dictionaries for export."""
@@ -389,8 +470,8 @@ class FolderScanner:
                 'directory': os.path.dirname(rel_path) or '.',
                 'extension': file_entry.extension,
                 'size': file_entry.size,
-                'size_formatted': self._format_size(file_entry.size),
-                'modified': file_entry.modified.strftime('%Y-%m-%d %H:%M:%S'),
+                'size_formatted': file_entry.size_str or self._format_size(file_entry.size),
+                'modified': file_entry.modified_dt.strftime('%Y-%m-%d %H:%M:%S'),
                 'is_binary': file_entry.is_binary,
                 'encoding': file_entry.encoding,
                 'has_content': file_entry.content is not None,
@@ -525,7 +606,7 @@ class FolderScanner:
 
         # ===== Sheet 4: Directory Tree =====
         ws_tree = wb.create_sheet("Directory Tree")
-        tree_lines = self.generate_tree(result, include_files=False).split('\n')
+        tree_lines = self._iter_tree_lines(result.root_entry, include_files=False)
         for row_idx, line in enumerate(tree_lines, 1):
             ws_tree.cell(row=row_idx, column=1, value=line)
         ws_tree.column_dimensions['A'].width = 80
@@ -658,8 +739,7 @@ class FolderScanner:
             f.write("\n" + "=" * 80 + "\n")
             f.write("STRUCTURE DU PROJET\n")
             f.write("=" * 80 + "\n\n")
-            f.write(self.generate_tree(result, include_files=True))
-            f.write("\n")
+            self.write_tree(f, result, include_files=True)
 
             # File contents
             f.write("\n" + "=" * 80 + "\n")
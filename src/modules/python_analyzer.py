@@ -4,13 +4,19 @@ Extracts classes, functions, imports, and generates comprehensive reports.
 """
 
 import ast
+import asyncio
+import fnmatch
+import io
 import os
 import re
+import threading
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import count
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Any
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, FrozenSet, List, Optional, Set, TextIO, Tuple, Any
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 
 
 @dataclass
@@ -45,7 +51,7 @@ class FileAnalysis:
     path: str
     name: str
     size: int
-    modified: datetime
+    modified: float  # st_mtime, converted lazily by modified_dt
     line_count: int
     code_lines: int
     comment_lines: int
@@ -61,6 +67,11 @@ class FileAnalysis:
     encoding: str = "utf-8"
     parse_error: Optional[str] = None
 
+    @property
+    def modified_dt(self) -> datetime:
+        """Modification time as a datetime."""
+        return datetime.fromtimestamp(self.modified)
+
     @property
     def documentation_ratio(self) -> float:
         """Calculate the documentation ratio."""
@@ -75,12 +86,182 @@ class FileAnalysis:
         return len(self.functions) + sum(len(c.methods) for c in self.classes)
 
 
+# Whitespace-only lines, and lines whose first non-blank character is '#'
+_BLANK_LINE_RE = re.compile(r'^[^\S\n]*$', re.MULTILINE)
+_COMMENT_LINE_RE = re.compile(r'^[^\S\n]*#', re.MULTILINE)
+
+
+def _failed_analysis(file_path: str, error: Exception) -> FileAnalysis:
+    """Build the placeholder FileAnalysis recorded for a file that could not be analyzed."""
+    return FileAnalysis(
+        path=file_path,
+        name=os.path.basename(file_path),
+        size=0,
+        modified=time.time(),
+        line_count=0,
+        code_lines=0,
+        comment_lines=0,
+        blank_lines=0,
+        docstring_lines=0,
+        parse_error=str(error)
+    )
+
+
+# Constant types whose repr() is exactly what ast.unparse would print
+_REPR_CONSTANT_TYPES = (str, int, bool, type(None))
+
+
+def _fast_unparse(node: ast.expr) -> str:
+    """
+    ast.unparse with a fast path for the common annotation/decorator shapes.
+
+    Plain names, dotted names and simple constants are formatted directly;
+    anything else falls back to ast.unparse.
+    """
+    node_type = type(node)
+    if node_type is ast.Name:
+        return node.id
+    if node_type is ast.Attribute:
+        parts = [node.attr]
+        value = node.value
+        while type(value) is ast.Attribute:
+            parts.append(value.attr)
+            value = value.value
+        if type(value) is ast.Name:
+            parts.append(value.id)
+            return '.'.join(reversed(parts))
+    elif (node_type is ast.Constant and node.kind is None
+          and type(node.value) in _REPR_CONSTANT_TYPES):
+        return repr(node.value)
+    return ast.unparse(node)
+
+
+_worker_analyzer: Optional['PythonAnalyzer'] = None
+
+
+def _get_worker_analyzer() -> 'PythonAnalyzer':
+    """Return this process's shared analyzer, creating it on first use."""
+    global _worker_analyzer
+    if _worker_analyzer is None:
+        _worker_analyzer = PythonAnalyzer()
+    return _worker_analyzer
+
+
+def _analyze_file_worker(file_path: str) -> FileAnalysis:
+    """
+    Process-pool entry point for PythonAnalyzer.analyze_directory.
+
+    Module-level so only the path is pickled per task; each worker process
+    reuses its own analyzer.
+    """
+    try:
+        return _get_worker_analyzer().analyze_file(file_path)
+    except Exception as e:
+        return _failed_analysis(file_path, e)
+
+
+def _analyze_bytes_worker(file_path: str, stats: os.stat_result, data: bytes) -> FileAnalysis:
+    """Process-pool entry point for PythonAnalyzer.analyze_directory_async."""
+    try:
+        return _get_worker_analyzer()._analyze_bytes(Path(file_path), stats, data)[0]
+    except Exception as e:
+        return _failed_analysis(file_path, e)
+
+
+def _read_source(entry: os.DirEntry) -> Tuple[os.stat_result, bytes]:
+    """Blocking read used by analyze_directory_async's I/O thread pool."""
+    with open(entry.path, 'rb') as f:
+        return entry.stat(), f.read()
+
+
+class _AnalysisVisitor(ast.NodeVisitor):
+    """
+    Collect imports, classes, functions, globals, docstring line counts and
+    complexity for a module in one depth-first traversal.
+
+    Complexity branches are counted for the function being visited and
+    rolled up into the enclosing function when it is left, so nested
+    functions contribute to their parent's complexity.
+    """
+
+    def __init__(self, analyzer: 'PythonAnalyzer', analysis: FileAnalysis):
+        self.analyzer = analyzer
+        self.analysis = analysis
+        self.docstring_lines = 0
+        self._branches = 0
+
+    def _count_docstring(self, docstring: Optional[str]) -> None:
+        if docstring:
+            self.docstring_lines += docstring.count('\n') + 1
+
+    def visit_Module(self, node: ast.Module) -> None:
+        self._count_docstring(ast.get_docstring(node))
+        self.generic_visit(node)
+
+    def visit_Import(self, node: ast.Import) -> None:
+        for alias in node.names:
+            self.analysis.imports.append(alias.name)
+            self.analysis.dependencies.add(alias.name.split('.')[0])
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        if node.module:
+            self.analysis.from_imports.append(node.module)
+            self.analysis.dependencies.add(node.module.split('.')[0])
+
+    def visit_Assign(self, node: ast.Assign) -> None:
+        for target in node.targets:
+            if isinstance(target, ast.Name):
+                self.analysis.global_variables.append(target.id)
+        self.generic_visit(node)
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        class_info = self.analyzer._class_info(node)
+        self.analysis.classes.append(class_info)
+        self._count_docstring(class_info.docstring)
+
+        for child in (*node.bases, *node.keywords, *node.decorator_list):
+            self.visit(child)
+        for item in node.body:
+            if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                self._visit_function(item, class_info.methods, is_method=True)
+            else:
+                self.visit(item)
+
+    def visit_FunctionDef(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> None:
+        self._visit_function(node, self.analysis.functions)
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def _visit_function(self, node: ast.FunctionDef | ast.AsyncFunctionDef,
+                        target: List[FunctionInfo], is_method: bool = False) -> None:
+        func_info = self.analyzer._function_info(node, is_method)
+        target.append(func_info)
+        self._count_docstring(func_info.docstring)
+
+        outer_branches = self._branches
+        self._branches = 0
+        self.generic_visit(node)
+        func_info.complexity = 1 + self._branches
+        self._branches += outer_branches
+
+    def _visit_branch(self, node: ast.AST) -> None:
+        self._branches += 1
+        self.generic_visit(node)
+
+    visit_If = visit_While = visit_For = _visit_branch
+    visit_ExceptHandler = visit_With = visit_Assert = visit_comprehension = _visit_branch
+
+    def visit_BoolOp(self, node: ast.BoolOp) -> None:
+        self._branches += len(node.values) - 1
+        self.generic_visit(node)
+
+
 class PythonAnalyzer:
     """
     Analyze Python source files for structure, quality, and documentation.
     """
 
-    STDLIB_MODULES = {
+    STDLIB_MODULES = frozenset({
         'abc', 'argparse', 'ast', 'asyncio', 'base64', 'collections',
         'contextlib', 'copy', 'csv', 'dataclasses', 'datetime', 'decimal',
         'email', 'enum', 'functools', 'glob', 'hashlib', 'html', 'http',
@@ -89,56 +270,79 @@ class PythonAnalyzer:
         'platform', 'queue', 're', 'shutil', 'socket', 'sqlite3', 'string',
         'subprocess', 'sys', 'tempfile', 'threading', 'time', 'typing',
         'unittest', 'urllib', 'uuid', 'warnings', 'weakref', 'xml', 'zipfile'
-    }
+    })
+
+    SOURCE_ENCODINGS = ('utf-8-sig', 'utf-8', 'latin-1', 'cp1252')
+
+    # Below this many files, process start-up costs more than the GIL does
+    PROCESS_POOL_MIN_FILES = 50
 
     def __init__(self, max_workers: int = 4):
         self.max_workers = max_workers
+        # Dependencies seen so far by the running directory analysis
+        self._running_deps: Set[str] = set()
+        self._deps_lock = threading.Lock()
 
-    def analyze_file(self, file_path: str) -> FileAnalysis:
+    def analyze_file(self, file_path: str, dir_entry: Optional[os.DirEntry] = None) -> FileAnalysis:
         """
         Analyze a single Python file.
 
         Args:
             file_path: Path to the Python file
+            dir_entry: Optional os.DirEntry for the file, whose cached stat
+                result is reused instead of issuing another stat call
 
         Returns:
             FileAnalysis object with complete analysis
         """
+        return self._analyze_file_full(file_path, dir_entry)[0]
+
+    def _analyze_file_full(self, file_path: str, dir_entry: Optional[os.DirEntry] = None
+                           ) -> Tuple[FileAnalysis, Optional[str], Optional[ast.Module]]:
+        """
+        Analyze a file and also return its decoded source and parsed tree.
+
+        The source is None if the file could not be read, and the tree is None
+        if it could not be read or parsed.
+        """
         path = Path(file_path)
-        stats = path.stat()
+        stats = dir_entry.stat() if dir_entry is not None else path.stat()
 
-        # Read file content
-        encoding = self._detect_encoding(file_path)
+        # Read the file once as bytes and decode in memory
         try:
-            with open(file_path, 'r', encoding=encoding, errors='replace') as f:
-                content = f.read()
+            data = path.read_bytes()
         except Exception as e:
             return FileAnalysis(
                 path=str(path),
                 name=path.name,
                 size=stats.st_size,
-                modified=datetime.fromtimestamp(stats.st_mtime),
+                modified=stats.st_mtime,
                 line_count=0,
                 code_lines=0,
                 comment_lines=0,
                 blank_lines=0,
                 docstring_lines=0,
-                encoding=encoding,
                 parse_error=str(e)
-            )
+            ), None, None
+
+        return self._analyze_bytes(path, stats, data)
 
-        # Count line types
-        lines = content.split('\n')
-        line_count = len(lines)
-        blank_lines = sum(1 for line in lines if not line.strip())
-        comment_lines = sum(1 for line in lines if line.strip().startswith('#'))
+    def _analyze_bytes(self, path: Path, stats: os.stat_result,
+                       data: bytes) -> Tuple[FileAnalysis, str, Optional[ast.Module]]:
+        """Analyze already-read source bytes; returns the analysis, decoded source and tree."""
+        content, encoding = self._decode_source(data)
+
+        # Count line types with C-level regex scans instead of a list of lines
+        line_count = content.count('\n') + 1
+        blank_lines = len(_BLANK_LINE_RE.findall(content))
+        comment_lines = len(_COMMENT_LINE_RE.findall(content))
 
         # Parse AST
         analysis = FileAnalysis(
             path=str(path),
             name=path.name,
             size=stats.st_size,
-            modified=datetime.fromtimestamp(stats.st_mtime),
+            modified=stats.st_mtime,
             line_count=line_count,
             code_lines=0,
             comment_lines=comment_lines,
@@ -147,123 +351,97 @@ class PythonAnalyzer:
             encoding=encoding
         )
 
+        tree: Optional[ast.Module] = None
         try:
-            tree = ast.parse(content)
+            tree = ast.parse(content, filename=str(path), mode='exec', type_comments=False)
             self._analyze_ast(tree, analysis, content)
             analysis.code_lines = line_count - blank_lines - comment_lines - analysis.docstring_lines
         except SyntaxError as e:
             analysis.parse_error = f"Syntax error at line {e.lineno}: {e.msg}"
             analysis.code_lines = line_count - blank_lines - comment_lines
 
-        return analysis
+        return analysis, content, tree
 
-    def _detect_encoding(self, file_path: str) -> str:
-        """Detect file encoding."""
-        encodings = ['utf-8-sig', 'utf-8', 'latin-1', 'cp1252']
-        for encoding in encodings:
+    def _decode_source(self, data: bytes) -> Tuple[str, str]:
+        """Decode source bytes, returning (content, encoding) with newlines normalized."""
+        for encoding in self.SOURCE_ENCODINGS:
             try:
-                with open(file_path, 'r', encoding=encoding) as f:
-                    f.read(1024)
-                return encoding
+                content = data.decode(encoding)
+                break
             except UnicodeDecodeError:
                 continue
-        return 'latin-1'
+        else:
+            encoding = 'latin-1'
+            content = data.decode(encoding, errors='replace')
+
+        # Match text-mode reads: universal newlines
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        return content, encoding
 
     def _analyze_ast(self, tree: ast.AST, analysis: FileAnalysis, content: str) -> None:
-        """Analyze the AST of a Python file."""
-        for node in ast.walk(tree):
-            # Imports
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    analysis.imports.append(alias.name)
-                    analysis.dependencies.add(alias.name.split('.')[0])
-
-            elif isinstance(node, ast.ImportFrom):
-                if node.module:
-                    analysis.from_imports.append(node.module)
-                    analysis.dependencies.add(node.module.split('.')[0])
-
-            # Classes
-            elif isinstance(node, ast.ClassDef):
-                class_info = self._analyze_class(node)
-                analysis.classes.append(class_info)
-
-            # Top-level functions
-            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                if isinstance(node, ast.AsyncFunctionDef) or not self._is_method(node, tree):
-                    func_info = self._analyze_function(node)
-                    analysis.functions.append(func_info)
-
-            # Global variables
-            elif isinstance(node, ast.Assign):
-                for target in node.targets:
-                    if isinstance(target, ast.Name):
-                        analysis.global_variables.append(target.id)
+        """Analyze the AST of a Python file in a single traversal."""
+        visitor = _AnalysisVisitor(self, analysis)
+        visitor.visit(tree)
 
         # Check for __main__
         analysis.has_main = 'if __name__' in content
 
-        # Count docstring lines
-        analysis.docstring_lines = self._count_docstring_lines(tree)
+        analysis.docstring_lines = visitor.docstring_lines
 
-    def _analyze_class(self, node: ast.ClassDef) -> ClassInfo:
-        """Analyze a class definition."""
-        bases = []
+    def _class_info(self, node: ast.ClassDef) -> ClassInfo:
+        """Build a ClassInfo for a class definition, without its methods."""
+        bases: List[str] = []
         for base in node.bases:
             try:
-                bases.append(ast.unparse(base))
+                bases.append(_fast_unparse(base))
             except:
                 bases.append("Unknown")
 
-        methods = []
-        attributes = []
+        attributes: List[str] = []
 
         for item in node.body:
-            if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                func_info = self._analyze_function(item, is_method=True)
-                methods.append(func_info)
-            elif isinstance(item, ast.AnnAssign) and isinstance(item.target, ast.Name):
+            if isinstance(item, ast.AnnAssign) and isinstance(item.target, ast.Name):
                 attributes.append(item.target.id)
             elif isinstance(item, ast.Assign):
                 for target in item.targets:
                     if isinstance(target, ast.Name):
                         attributes.append(target.id)
 
-        decorators = [ast.unparse(d) for d in node.decorator_list]
+        decorators = [_fast_unparse(d) for d in node.decorator_list]
         docstring = ast.get_docstring(node)
 
         return ClassInfo(
             name=node.name,
             lineno=node.lineno,
             bases=bases,
-            methods=methods,
             attributes=attributes,
             docstring=docstring,
             decorators=decorators
         )
 
-    def _analyze_function(self, node, is_method: bool = False) -> FunctionInfo:
-        """Analyze a function definition."""
-        args = []
+    def _function_info(self, node: ast.FunctionDef | ast.AsyncFunctionDef,
+                       is_method: bool = False) -> FunctionInfo:
+        """Build a FunctionInfo for a function definition, without its complexity."""
+        args: List[str] = []
         for arg in node.args.args:
             arg_str = arg.arg
             if arg.annotation:
                 try:
-                    arg_str += f": {ast.unparse(arg.annotation)}"
+                    arg_str += f": {_fast_unparse(arg.annotation)}"
                 except:
                     pass
             args.append(arg_str)
 
-        return_type = None
+        return_type: Optional[str] = None
         if node.returns:
             try:
-                return_type = ast.unparse(node.returns)
+                return_type = _fast_unparse(node.returns)
             except:
                 pass
 
-        decorators = [ast.unparse(d) for d in node.decorator_list]
+        decorators = [_fast_unparse(d) for d in node.decorator_list]
         docstring = ast.get_docstring(node)
-        complexity = self._calculate_complexity(node)
 
         return FunctionInfo(
             name=node.name,
@@ -273,40 +451,9 @@ class PythonAnalyzer:
             decorators=decorators,
             docstring=docstring,
             is_async=isinstance(node, ast.AsyncFunctionDef),
-            is_method=is_method,
-            complexity=complexity
+            is_method=is_method
         )
 
-    def _calculate_complexity(self, node: ast.AST) -> int:
-        """Calculate cyclomatic complexity of a function."""
-        complexity = 1
-        for child in ast.walk(node):
-            if isinstance(child, (ast.If, ast.While, ast.For, ast.ExceptHandler,
-                                  ast.With, ast.Assert, ast.comprehension)):
-                complexity += 1
-            elif isinstance(child, ast.BoolOp):
-                complexity += len(child.values) - 1
-        return complexity
-
-    def _is_method(self, node: ast.FunctionDef, tree: ast.AST) -> bool:
-        """Check if a function is a method inside a class."""
-        for item in ast.walk(tree):
-            if isinstance(item, ast.ClassDef):
-                for child in item.body:
-                    if child is node:
-                        return True
-        return False
-
-    def _count_docstring_lines(self, tree: ast.AST) -> int:
-        """Count total docstring lines in the file."""
-        count = 0
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.Module, ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
-                docstring = ast.get_docstring(node)
-                if docstring:
-                    count += len(docstring.split('\n'))
-        return count
-
     def analyze_directory(self, directory: str, include_subdirs: bool = True,
                          pattern: Optional[str] = None,
                          exclude_dirs: Optional[List[str]] = None) -> List[FileAnalysis]:
@@ -322,52 +469,142 @@ class PythonAnalyzer:
         Returns:
             List of FileAnalysis objects
         """
-        exclude_dirs = exclude_dirs or ['__pycache__', '.git', 'venv', '.venv', 'node_modules']
-        files = []
-
-        if include_subdirs:
-            for root, dirs, filenames in os.walk(directory):
-                dirs[:] = [d for d in dirs if d not in exclude_dirs]
-                for filename in filenames:
-                    if filename.endswith('.py'):
-                        if pattern is None or re.search(pattern, filename):
-                            files.append(os.path.join(root, filename))
-        else:
-            for filename in os.listdir(directory):
-                if filename.endswith('.py'):
-                    if pattern is None or re.search(pattern, filename):
-                        files.append(os.path.join(directory, filename))
+        entries = self._collect_python_entries(directory, include_subdirs, pattern, exclude_dirs)
+        self._reset_running_deps()
 
-        # Analyze files in parallel
+        # Analyze files in parallel: AST work is CPU-bound, so large batches
+        # go to worker processes to sidestep the GIL
         results = []
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = {executor.submit(self.analyze_file, f): f for f in files}
-            for future in as_completed(futures):
-                try:
-                    results.append(future.result())
-                except Exception as e:
-                    file_path = futures[future]
-                    results.append(FileAnalysis(
-                        path=file_path,
-                        name=os.path.basename(file_path),
-                        size=0,
-                        modified=datetime.now(),
-                        line_count=0,
-                        code_lines=0,
-                        comment_lines=0,
-                        blank_lines=0,
-                        docstring_lines=0,
-                        parse_error=str(e)
-                    ))
-
-        return sorted(results, key=lambda x: x.path)
+        if len(entries) >= self.PROCESS_POOL_MIN_FILES:
+            # DirEntry objects cannot be pickled; workers stat the file themselves
+            paths = [e.path for e in entries]
+            chunksize = max(1, len(paths) // (4 * self.max_workers))
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                for analysis in executor.map(_analyze_file_worker, paths, chunksize=chunksize):
+                    results.append(self._record_dependencies(analysis))
+        else:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = {executor.submit(self.analyze_file, e.path, e): e.path for e in entries}
+                for future in as_completed(futures):
+                    try:
+                        results.append(self._record_dependencies(future.result()))
+                    except Exception as e:
+                        results.append(_failed_analysis(futures[future], e))
+
+        return self._finish_directory_analysis(results)
+
+    async def analyze_directory_async(self, directory: str, include_subdirs: bool = True,
+                                      pattern: Optional[str] = None,
+                                      exclude_dirs: Optional[List[str]] = None,
+                                      max_concurrent_reads: int = 64) -> List[FileAnalysis]:
+        """
+        Analyze all Python files in a directory, overlapping file reads with parsing.
+
+        Reads are issued concurrently from a thread pool (up to
+        max_concurrent_reads in flight) so the disk queue stays full on
+        cold caches, while parsing runs in worker processes. Takes the same
+        filters as analyze_directory and returns the same result.
+
+        Args:
+            directory: Root directory to analyze
+            include_subdirs: Include subdirectories
+            pattern: Regex pattern to filter files
+            exclude_dirs: Directories to exclude
+            max_concurrent_reads: Maximum number of files read at once
+
+        Returns:
+            List of FileAnalysis objects
+        """
+        entries = self._collect_python_entries(directory, include_subdirs, pattern, exclude_dirs)
+        self._reset_running_deps()
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(max_concurrent_reads)
+
+        with ThreadPoolExecutor(max_workers=max_concurrent_reads) as io_pool:
+            if len(entries) >= self.PROCESS_POOL_MIN_FILES:
+                cpu_pool = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                cpu_pool = io_pool
+
+            async def analyze(entry: os.DirEntry) -> FileAnalysis:
+                async with semaphore:
+                    try:
+                        stats, data = await loop.run_in_executor(io_pool, _read_source, entry)
+                    except OSError as e:
+                        return _failed_analysis(entry.path, e)
+                    analysis = await loop.run_in_executor(cpu_pool, _analyze_bytes_worker,
+                                                          entry.path, stats, data)
+                    return self._record_dependencies(analysis)
+
+            try:
+                results = await asyncio.gather(*(analyze(e) for e in entries))
+            finally:
+                if cpu_pool is not io_pool:
+                    cpu_pool.shutdown()
+
+        return self._finish_directory_analysis(results)
+
+    def _reset_running_deps(self) -> None:
+        """Start a new directory analysis with no live dependencies."""
+        with self._deps_lock:
+            self._running_deps = set()
+
+    def _record_dependencies(self, analysis: FileAnalysis) -> FileAnalysis:
+        """Fold a finished file's dependencies into the live set and return it."""
+        with self._deps_lock:
+            self._running_deps.update(analysis.dependencies)
+        return analysis
+
+    def _finish_directory_analysis(self, results: List[FileAnalysis]) -> List[FileAnalysis]:
+        """Sort the results of a directory analysis by path."""
+        results.sort(key=lambda x: x.path)
+        return results
+
+    def get_live_external_dependencies(self) -> Set[str]:
+        """
+        Get the external dependencies found so far by the running analysis.
+
+        Safe to call from another thread (e.g. the UI) while analyze_directory
+        is in progress; after it returns, this matches get_external_dependencies
+        on its result.
+
+        Returns:
+            Set of non-stdlib top-level module names
+        """
+        with self._deps_lock:
+            return self._running_deps - self.STDLIB_MODULES
+
+    def _collect_python_entries(self, directory: str, include_subdirs: bool,
+                                pattern: Optional[str],
+                                exclude_dirs: Optional[List[str]]) -> List[os.DirEntry]:
+        """List the .py files analyze_directory should process."""
+        exclude_dirs = frozenset(exclude_dirs or ['__pycache__', '.git', 'venv', '.venv', 'node_modules'])
+        pattern_re = re.compile(pattern) if pattern else None
+        return [
+            entry for entry in self._scan_python_files(directory, include_subdirs, exclude_dirs)
+            if pattern_re is None or pattern_re.search(entry.name)
+        ]
+
+    def _scan_python_files(self, directory: str, include_subdirs: bool,
+                           exclude_dirs: Set[str] | FrozenSet[str]):
+        """Yield os.DirEntry objects for .py files, walking with os.scandir."""
+        stack = [directory]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            if include_subdirs and entry.name not in exclude_dirs:
+                                stack.append(entry.path)
+                        elif entry.name.endswith('.py'):
+                            yield entry
+            except OSError:
+                continue
 
     def get_external_dependencies(self, analyses: List[FileAnalysis]) -> Set[str]:
         """Get all external (non-stdlib) dependencies."""
-        all_deps = set()
-        for analysis in analyses:
-            all_deps.update(analysis.dependencies)
-        return all_deps - self.STDLIB_MODULES
+        return set().union(*[a.dependencies for a in analyses]) - self.STDLIB_MODULES
 
     def generate_summary(self, analyses: List[FileAnalysis]) -> Dict[str, Any]:
         """Generate a summary of the analysis."""
@@ -394,7 +631,8 @@ class PythonAnalyzer:
                                 exclude_patterns: Optional[List[str]] = None,
                                 exclude_dirs: Optional[List[str]] = None,
                                 include_content: bool = True,
-                                max_file_size_kb: int = 500) -> str:
+                                max_file_size_kb: int = 500,
+                                sink: Optional[TextIO] = None) -> Optional[str]:
         """
         Extract all Python code into a hierarchical text representation.
 
@@ -405,139 +643,137 @@ class PythonAnalyzer:
             exclude_dirs: Directories to exclude
             include_content: Include actual file content
             max_file_size_kb: Maximum file size to include content (in KB)
+            sink: Optional writable text stream; when given, the extraction is
+                written to it section by section instead of built in memory
 
         Returns:
-            Formatted string with hierarchical code representation
+            Formatted string with hierarchical code representation, or None
+            when the output was written to sink
         """
         exclude_dirs = exclude_dirs or ['__pycache__', '.git', 'venv', '.venv',
                                          'node_modules', '.idea', '.vscode', 'dist', 'build']
         exclude_patterns = exclude_patterns or []
 
-        output_lines = []
+        out = sink if sink is not None else io.StringIO()
+        w = out.write
         root_path = Path(directory)
+        separator = "=" * 80 + "\n"
+        rule = "-" * 40 + "\n"
 
         # Header
-        output_lines.append("=" * 80)
-        output_lines.append(f"  CODE EXTRACTION - {root_path.name}")
-        output_lines.append(f"  Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        output_lines.append("=" * 80)
-        output_lines.append("")
-
-        # Collect files
-        files = []
-        if include_subdirs:
-            for root, dirs, filenames in os.walk(directory):
-                dirs[:] = [d for d in dirs if d not in exclude_dirs]
-                for filename in filenames:
-                    if filename.endswith('.py'):
-                        if not self._matches_exclude_pattern(filename, exclude_patterns):
-                            files.append(os.path.join(root, filename))
-        else:
-            for filename in os.listdir(directory):
-                if filename.endswith('.py'):
-                    if not self._matches_exclude_pattern(filename, exclude_patterns):
-                        files.append(os.path.join(directory, filename))
-
-        files.sort()
+        w(separator)
+        w(f"  CODE EXTRACTION - {root_path.name}\n")
+        w(f"  Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        w(separator)
+        w("\n")
+
+        # Collect files; DirEntry objects carry cached stat results
+        compiled_excludes = self._compile_exclude_patterns(exclude_patterns)
+        entries = sorted(
+            (entry for entry in self._scan_python_files(directory, include_subdirs, frozenset(exclude_dirs))
+             if not self._matches_exclude_pattern(entry.name, compiled_excludes)),
+            key=lambda entry: entry.path
+        )
+        files = [entry.path for entry in entries]
 
         # Generate table of contents
-        output_lines.append("TABLE OF CONTENTS")
-        output_lines.append("-" * 40)
+        w("TABLE OF CONTENTS\n")
+        w(rule)
         for i, file_path in enumerate(files, 1):
             rel_path = os.path.relpath(file_path, directory)
-            output_lines.append(f"  {i:3}. {rel_path}")
-        output_lines.append("")
-        output_lines.append(f"Total: {len(files)} Python files")
-        output_lines.append("")
+            w(f"  {i:3}. {rel_path}\n")
+        w("\n")
+        w(f"Total: {len(files)} Python files\n")
+        w("\n")
 
         # Process each file
-        for file_path in files:
+        for entry in entries:
+            file_path = entry.path
             rel_path = os.path.relpath(file_path, directory)
-            file_size = os.path.getsize(file_path)
+            file_size = entry.stat().st_size
 
-            output_lines.append("")
-            output_lines.append("=" * 80)
-            output_lines.append(f"FILE: {rel_path}")
-            output_lines.append(f"Size: {file_size:,} bytes | Path: {file_path}")
-            output_lines.append("=" * 80)
+            w("\n")
+            w(separator)
+            w(f"FILE: {rel_path}\n")
+            w(f"Size: {file_size:,} bytes | Path: {file_path}\n")
+            w(separator)
 
-            # Analyze file structure
-            analysis = self.analyze_file(file_path)
+            # Analyze file structure, keeping the source for the CODE block
+            analysis, content = self._analyze_file_full(file_path, entry)[:2]
 
             # Show structure summary
-            output_lines.append("")
-            output_lines.append("STRUCTURE:")
-            output_lines.append(f"  Lines: {analysis.line_count} (Code: {analysis.code_lines}, Comments: {analysis.comment_lines}, Blank: {analysis.blank_lines})")
+            w("\n")
+            w("STRUCTURE:\n")
+            w(f"  Lines: {analysis.line_count} (Code: {analysis.code_lines}, Comments: {analysis.comment_lines}, Blank: {analysis.blank_lines})\n")
 
             if analysis.imports or analysis.from_imports:
-                output_lines.append(f"  Imports: {', '.join(analysis.imports + analysis.from_imports)}")
+                w(f"  Imports: {', '.join(analysis.imports + analysis.from_imports)}\n")
 
             if analysis.classes:
-                output_lines.append(f"  Classes ({len(analysis.classes)}):")
+                w(f"  Classes ({len(analysis.classes)}):\n")
                 for cls in analysis.classes:
                     bases = f"({', '.join(cls.bases)})" if cls.bases else ""
-                    output_lines.append(f"    - {cls.name}{bases} [line {cls.lineno}]")
+                    w(f"    - {cls.name}{bases} [line {cls.lineno}]\n")
                     for method in cls.methods:
                         args = ", ".join(method.args)
                         async_prefix = "async " if method.is_async else ""
-                        output_lines.append(f"        {async_prefix}def {method.name}({args}) [line {method.lineno}]")
+                        w(f"        {async_prefix}def {method.name}({args}) [line {method.lineno}]\n")
 
             if analysis.functions:
-                output_lines.append(f"  Functions ({len(analysis.functions)}):")
+                w(f"  Functions ({len(analysis.functions)}):\n")
                 for func in analysis.functions:
                     args = ", ".join(func.args)
                     async_prefix = "async " if func.is_async else ""
                     ret = f" -> {func.return_type}" if func.return_type else ""
-                    output_lines.append(f"    - {async_prefix}def {func.name}({args}){ret} [line {func.lineno}]")
+                    w(f"    - {async_prefix}def {func.name}({args}){ret} [line {func.lineno}]\n")
 
             # Include content if requested and file not too large
             if include_content and file_size <= max_file_size_kb * 1024:
-                output_lines.append("")
-                output_lines.append("-" * 40)
-                output_lines.append("CODE:")
-                output_lines.append("-" * 40)
-
-                try:
-                    with open(file_path, 'r', encoding=analysis.encoding, errors='replace') as f:
-                        content = f.read()
-
-                    # Add line numbers
-                    lines = content.split('\n')
-                    max_line_num = len(str(len(lines)))
-                    for i, line in enumerate(lines, 1):
-                        output_lines.append(f"{i:>{max_line_num}} | {line}")
-                except Exception as e:
-                    output_lines.append(f"  [Error reading file: {e}]")
+                w("\n")
+                w(rule)
+                w("CODE:\n")
+                w(rule)
+
+                if content is None:
+                    w(f"  [Error reading file: {analysis.parse_error}]\n")
+                else:
+                    # Add line numbers without keeping a list of lines alive
+                    width = len(str(content.count('\n') + 1))
+                    line_fmt = f"%{width}d | %s\n"
+                    out.writelines(map(line_fmt.__mod__, zip(count(1), content.split('\n'))))
 
             elif include_content:
-                output_lines.append("")
-                output_lines.append(f"  [File too large: {file_size / 1024:.1f} KB > {max_file_size_kb} KB limit]")
+                w("\n")
+                w(f"  [File too large: {file_size / 1024:.1f} KB > {max_file_size_kb} KB limit]\n")
+
+            # Drop this file's source before the next one is read and parsed
+            del content
 
         # Footer with summary
-        output_lines.append("")
-        output_lines.append("=" * 80)
-        output_lines.append("SUMMARY")
-        output_lines.append("=" * 80)
-
-        total_lines = sum(self.analyze_file(f).line_count for f in files[:10])  # Sample for performance
-        output_lines.append(f"Total files: {len(files)}")
-        output_lines.append(f"Excluded directories: {', '.join(exclude_dirs)}")
+        w("\n")
+        w(separator)
+        w("SUMMARY\n")
+        w(separator)
+
+        w(f"Total files: {len(files)}\n")
+        w(f"Excluded directories: {', '.join(exclude_dirs)}\n")
         if exclude_patterns:
-            output_lines.append(f"Excluded patterns: {', '.join(exclude_patterns)}")
-        output_lines.append("")
-        output_lines.append("=" * 80)
-        output_lines.append("  END OF EXTRACTION")
-        output_lines.append("=" * 80)
-
-        return '\n'.join(output_lines)
-
-    def _matches_exclude_pattern(self, filename: str, patterns: List[str]) -> bool:
-        """Check if filename matches any exclude pattern."""
-        import fnmatch
-        for pattern in patterns:
-            if fnmatch.fnmatch(filename, pattern):
-                return True
-        return False
+            w(f"Excluded patterns: {', '.join(exclude_patterns)}\n")
+        w("\n")
+        w(separator)
+        w("  END OF EXTRACTION\n")
+        w("=" * 80)
+
+        return out.getvalue() if sink is None else None
+
+    def _compile_exclude_patterns(self, patterns: List[str]) -> List[re.Pattern]:
+        """Translate glob exclude patterns to compiled regexes once per extraction."""
+        return [re.compile(fnmatch.translate(os.path.normcase(p))) for p in patterns]
+
+    def _matches_exclude_pattern(self, filename: str, patterns: List[re.Pattern]) -> bool:
+        """Check if filename matches any compiled exclude pattern (fnmatch semantics)."""
+        name = os.path.normcase(filename)
+        return any(p.match(name) for p in patterns)
 
     def save_code_extraction(self, directory: str, output_path: str, **kwargs) -> bool:
         """
@@ -552,9 +788,9 @@ class PythonAnalyzer:
             True if successful, False otherwise
         """
         try:
-            content = self.extract_code_hierarchy(directory, **kwargs)
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            # Stream straight into the file rather than building the report in memory
+            with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                self.extract_code_hierarchy(directory, sink=f, **kwargs)
             return True
         except Exception as e:
             print(f"Error saving extraction: {e}")
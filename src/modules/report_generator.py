@@ -4,83 +4,20 @@ Supports HTML, Markdown, JSON, and plain text output.
 """
 
 import json
+import math
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from pathlib import Path
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from pathlib import Path, PosixPath, WindowsPath
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 import html
 
 
-class ReportGenerator:
-    """
-    Generate professional reports in multiple formats.
-    Supports HTML, Markdown, JSON, and text output.
-    """
-
-    def __init__(self, title: str = "Code Analysis Report"):
-        self.title = title
-        self.generated_at = datetime.now()
-
-    def generate_html(self, data: Dict[str, Any], output_path: str,
-                      template: str = "modern") -> None:
-        """Generate an HTML report with modern styling."""
-        html_content = self._build_html(data, template)
-
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-
-    def generate_markdown(self, data: Dict[str, Any], output_path: str) -> None:
-        """Generate a Markdown report."""
-        md_content = self._build_markdown(data)
-
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(md_content)
-
-    def generate_json(self, data: Dict[str, Any], output_path: str,
-                      indent: int = 2) -> None:
-        """Generate a JSON report."""
-        # Convert datetime objects to strings
-        serializable = self._make_serializable(data)
-
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(serializable, f, indent=indent, ensure_ascii=False)
-
-    def generate_text(self, data: Dict[str, Any], output_path: str) -> None:
-        """Generate a plain text report."""
-        text_content = self._build_text(data)
-
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(text_content)
-
-    def _make_serializable(self, obj: Any) -> Any:
-        """Convert an object to be JSON serializable."""
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        elif isinstance(obj, Path):
-            return str(obj)
-        elif isinstance(obj, set):
-            return list(obj)
-        elif isinstance(obj, dict):
-            return {k: self._make_serializable(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [self._make_serializable(item) for item in obj]
-        elif hasattr(obj, '__dict__'):
-            return self._make_serializable(obj.__dict__)
-        return obj
-
-    def _build_html(self, data: Dict[str, Any], template: str) -> str:
-        """Build HTML content."""
-        stats = data.get('statistics', {})
-        files = data.get('files', [])
-
-        return f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{html.escape(self.title)}</title>
-    <style>
-        :root {{
+# Static stylesheet and footer shared by every HTML report. The stylesheet
+# is kept readable here and minified once at import.
+_HTML_BASE_STYLE_SOURCE = """        :root {
             --primary: #3b82f6;
             --primary-dark: #2563eb;
             --bg: #0f172a;
@@ -91,152 +28,349 @@ class ReportGenerator:
             --success: #10b981;
             --warning: #f59e0b;
             --danger: #ef4444;
-        }}
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{
+        }
+        * { margin: 0; padding: 0; box-sizing: border-box; }
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
             background: var(--bg);
             color: var(--text);
             line-height: 1.6;
-        }}
-        .container {{ max-width: 1400px; margin: 0 auto; padding: 2rem; }}
-        .header {{ text-align: center; margin-bottom: 3rem; }}
-        h1 {{
+        }
+        .container { max-width: 1400px; margin: 0 auto; padding: 2rem; }
+        .header { text-align: center; margin-bottom: 3rem; }
+        h1 {
             font-size: 2.5rem;
             background: linear-gradient(135deg, var(--primary) 0%, #06b6d4 100%);
             -webkit-background-clip: text;
             -webkit-text-fill-color: transparent;
             margin-bottom: 0.5rem;
-        }}
-        .date {{ color: var(--text-secondary); font-size: 0.875rem; }}
-        .stats-grid {{
+        }
+        .date { color: var(--text-secondary); font-size: 0.875rem; }
+        .stats-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
             gap: 1.5rem;
             margin: 2rem 0;
-        }}
-        .stat-card {{
+        }
+        .stat-card {
             background: var(--bg-secondary);
             border: 1px solid var(--border);
             border-radius: 12px;
             padding: 1.5rem;
             transition: transform 0.2s;
-        }}
-        .stat-card:hover {{ transform: translateY(-2px); }}
-        .stat-value {{
+        }
+        .stat-card:hover { transform: translateY(-2px); }
+        .stat-value {
             font-size: 2rem;
             font-weight: 700;
             color: var(--primary);
-        }}
-        .stat-label {{
+        }
+        .stat-label {
             font-size: 0.875rem;
             color: var(--text-secondary);
-        }}
-        .section {{
+        }
+"""
+
+# Rules only needed when the report has a files table
+_HTML_TABLE_STYLE_SOURCE = """        .section {
             background: var(--bg-secondary);
             border: 1px solid var(--border);
             border-radius: 12px;
             padding: 1.5rem;
             margin: 2rem 0;
-        }}
-        .section h2 {{
+        }
+        .section h2 {
             color: var(--primary);
             margin-bottom: 1rem;
             padding-bottom: 0.5rem;
             border-bottom: 1px solid var(--border);
-        }}
-        table {{
+        }
+        table {
             width: 100%;
             border-collapse: collapse;
             margin: 1rem 0;
-        }}
-        th, td {{
+        }
+        th, td {
             padding: 0.75rem;
             text-align: left;
             border-bottom: 1px solid var(--border);
-        }}
-        th {{ color: var(--text-secondary); font-weight: 600; }}
-        tr:hover {{ background: var(--bg); }}
-        .badge {{
+        }
+        th { color: var(--text-secondary); font-weight: 600; }
+        tr:hover { background: var(--bg); }
+"""
+
+_HTML_TAIL_STYLE_SOURCE = """        .badge {
             display: inline-block;
             padding: 0.25rem 0.75rem;
             border-radius: 20px;
             font-size: 0.75rem;
             font-weight: 600;
-        }}
-        .badge-success {{ background: var(--success); color: white; }}
-        .badge-warning {{ background: var(--warning); color: black; }}
-        .badge-danger {{ background: var(--danger); color: white; }}
-        .footer {{
+        }
+        .badge-success { background: var(--success); color: white; }
+        .badge-warning { background: var(--warning); color: black; }
+        .badge-danger { background: var(--danger); color: white; }
+        .footer {
             text-align: center;
             margin-top: 3rem;
             padding-top: 2rem;
             border-top: 1px solid var(--border);
             color: var(--text-secondary);
-        }}
-    </style>
+        }
+"""
+
+
+def _minify_css(css: str) -> str:
+    """Strip comments and the whitespace around CSS punctuation."""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s*([{}:;,>])\s*', r'\1', css)
+    return css.replace(';}', '}').strip()
+
+
+_HTML_STYLE = _minify_css(_HTML_BASE_STYLE_SOURCE + _HTML_TABLE_STYLE_SOURCE
+                          + _HTML_TAIL_STYLE_SOURCE)
+# Reports without files skip the table rules
+_HTML_STYLE_NO_TABLE = _minify_css(_HTML_BASE_STYLE_SOURCE + _HTML_TAIL_STYLE_SOURCE)
+
+_HTML_TAIL = """
+
+        <div class="footer">
+            <p>Generated by CodeExtractPro</p>
+        </div>
+    </div>
+</body>
+</html>"""
+
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _format_size(size: int) -> str:
+    """Format size to human-readable string (memoized: reports repeat sizes)."""
+    if size < 1024:
+        return f"{size} B"
+    # Each unit is 2**10 of the previous, so the bit length picks it directly
+    index = min((int(size).bit_length() - 1) // 10, 4)
+    return f"{size / (1 << (index * 10)):.1f} {_SIZE_UNITS[index]}"
+
+
+# Exact-type converters tried before the isinstance chain in _ReportEncoder
+_JSON_CONVERTERS = {
+    datetime: datetime.isoformat,
+    PosixPath: str,
+    WindowsPath: str,
+    set: list,
+}
+
+
+class _ReportEncoder(json.JSONEncoder):
+    """JSON encoder for report data: dates, paths, sets and plain objects."""
+
+    def default(self, o: Any) -> Any:
+        converter = _JSON_CONVERTERS.get(type(o))
+        if converter is not None:
+            return converter(o)
+        if isinstance(o, datetime):
+            return o.isoformat()
+        if isinstance(o, Path):
+            return str(o)
+        if isinstance(o, set):
+            return list(o)
+        if hasattr(o, '__dict__'):
+            return o.__dict__
+        return super().default(o)
+
+
+def _has_json_only_floats(data: Any) -> bool:
+    """
+    Check report data for floats that orjson spells differently from json.
+
+    json writes NaN and Infinity, which orjson turns into null, and keeps the
+    exponent sign and padding of repr() (1e+16, 1e-07) where orjson does not.
+    Containers and plain objects are walked as _ReportEncoder would encode them.
+    """
+    stack = [data]
+    seen = set()
+    while stack:
+        o = stack.pop()
+        if isinstance(o, float):
+            if not math.isfinite(o) or 'e' in repr(o):
+                return True
+        elif isinstance(o, (str, int)):
+            continue
+        elif id(o) in seen:
+            continue  # json rejects the cycle itself
+        elif isinstance(o, dict):
+            seen.add(id(o))
+            stack.extend(o)
+            stack.extend(o.values())
+        elif isinstance(o, (list, tuple, set, frozenset)):
+            seen.add(id(o))
+            stack.extend(o)
+        elif hasattr(o, '__dict__') and not isinstance(o, type):
+            seen.add(id(o))
+            stack.extend(o.__dict__.values())
+    return False
+
+
+class ReportGenerator:
+    """
+    Generate professional reports in multiple formats.
+    Supports HTML, Markdown, JSON, and text output.
+    """
+
+    # Statistics shown as HTML cards, in display order
+    STAT_LABELS: Dict[str, str] = {
+        'total_files': 'Total Files',
+        'total_lines': 'Total Lines',
+        'total_code_lines': 'Code Lines',
+        'total_classes': 'Classes',
+        'total_functions': 'Functions',
+        'total_modules': 'VBA Modules'
+    }
+
+    def __init__(self, title: str = "Code Analysis Report"):
+        self.title = title
+        self.generated_at = datetime.now()
+        # Formatted once; every report format shows the same values
+        self._generated_str = self.generated_at.isoformat(' ', timespec='seconds')
+        self._title_html = html.escape(title)
+
+    def generate_html(self, data: Dict[str, Any], output_path: str,
+                      template: str = "modern") -> None:
+        """Generate an HTML report with modern styling."""
+        self._write_parts(output_path, self._html_parts(data, template))
+
+    def generate_markdown(self, data: Dict[str, Any], output_path: str) -> None:
+        """Generate a Markdown report."""
+        self._write_parts(output_path, self._iter_markdown(data))
+
+    def generate_json(self, data: Dict[str, Any], output_path: str,
+                      indent: int = 2) -> None:
+        """Generate a JSON report."""
+        # orjson only knows the two-space layout; anything else, and floats it
+        # would write differently, uses json so the bytes do not depend on
+        # whether orjson is installed
+        if indent == 2 and not _has_json_only_floats(data):
+            try:
+                # Optional, and only needed here, so not imported with the module
+                import orjson
+            except ImportError:
+                pass
+            else:
+                try:
+                    # Datetimes and dataclasses go through the encoder too:
+                    # orjson would drop _private dataclass fields
+                    content = orjson.dumps(data, default=_ReportEncoder().default,
+                                           option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                                           | orjson.OPT_PASSTHROUGH_DATACLASS
+                                           | orjson.OPT_PASSTHROUGH_DATETIME)
+                except orjson.JSONEncodeError:
+                    pass  # e.g. integers beyond 64 bits; let json handle it
+                else:
+                    with open(output_path, 'wb', buffering=1 << 20) as f:
+                        f.write(content)
+                    return
+
+        # The encoder converts datetimes, paths and sets as the C encoder
+        # reaches them, so the data is not copied first. Encoding in one call
+        # also avoids json.dump's write per token.
+        content = json.dumps(data, cls=_ReportEncoder, indent=indent, ensure_ascii=False)
+        self._write_file(output_path, content)
+
+    def generate_text(self, data: Dict[str, Any], output_path: str) -> None:
+        """Generate a plain text report."""
+        self._write_parts(output_path, self._iter_text(data))
+
+    def generate_all(self, data: Dict[str, Any], base_path: str) -> List[str]:
+        """
+        Generate the HTML, Markdown, JSON and text reports concurrently.
+
+        The generators only read self and data, so the four formats are
+        written in parallel and disk writes overlap with serialization.
+
+        Args:
+            data: Report data shared by all formats
+            base_path: Output path without extension
+
+        Returns:
+            Paths of the generated reports
+        """
+        jobs = [
+            (self.generate_html, base_path + '.html'),
+            (self.generate_markdown, base_path + '.md'),
+            (self.generate_json, base_path + '.json'),
+            (self.generate_text, base_path + '.txt'),
+        ]
+        with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+            futures = [executor.submit(generate, data, path) for generate, path in jobs]
+            for future in futures:
+                future.result()  # re-raise the first failure
+        return [path for _, path in jobs]
+
+    def _write_file(self, output_path: str, content: str) -> None:
+        """Write an assembled report through a 1 MiB buffer."""
+        with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.write(content)
+
+    def _write_parts(self, output_path: str, parts: Iterable[str]) -> None:
+        """Stream report fragments to disk; the 1 MiB buffer coalesces the writes."""
+        with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.writelines(parts)
+
+    def _build_html(self, data: Dict[str, Any], template: str) -> str:
+        """Build HTML content."""
+        return ''.join(self._html_parts(data, template))
+
+    def _html_parts(self, data: Dict[str, Any], template: str) -> Iterator[str]:
+        """Yield the HTML report as fragments, in document order."""
+        stats = data.get('statistics', {})
+        files = data.get('files', [])
+        title = self._title_html
+
+        # Only the title and date vary; the stylesheet is yielded as-is
+        yield f'''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title}</title>
+    <style>'''
+        yield _HTML_STYLE if files else _HTML_STYLE_NO_TABLE
+        yield f'''</style>
 </head>
 <body>
     <div class="container">
         <div class="header">
-            <h1>{html.escape(self.title)}</h1>
-            <p class="date">Generated: {self.generated_at.strftime('%Y-%m-%d %H:%M:%S')}</p>
+            <h1>{title}</h1>
+            <p class="date">Generated: {self._generated_str}</p>
         </div>
 
         <div class="stats-grid">
-            {self._build_stat_cards(stats)}
+            '''
+        yield from self._stat_card_parts(stats)
+        yield '''
         </div>
 
-        {self._build_files_section(files)}
-
-        <div class="footer">
-            <p>Generated by CodeExtractPro</p>
-        </div>
-    </div>
-</body>
-</html>'''
-
-    def _build_stat_cards(self, stats: Dict[str, Any]) -> str:
-        """Build HTML stat cards."""
-        cards = []
-        stat_labels = {
-            'total_files': 'Total Files',
-            'total_lines': 'Total Lines',
-            'total_code_lines': 'Code Lines',
-            'total_classes': 'Classes',
-            'total_functions': 'Functions',
-            'total_modules': 'VBA Modules'
-        }
+        '''
+        if files:
+            yield from self._files_section_parts(files)
+        yield _HTML_TAIL
 
-        for key, label in stat_labels.items():
+    def _stat_card_parts(self, stats: Dict[str, Any]) -> Iterator[str]:
+        """Yield the HTML stat cards."""
+        for key, label in self.STAT_LABELS.items():
             value = stats.get(key, 0)
             if value:
-                cards.append(f'''
+                yield f'''
                 <div class="stat-card">
                     <div class="stat-value">{value:,}</div>
                     <div class="stat-label">{label}</div>
-                </div>''')
-
-        return ''.join(cards)
+                </div>'''
 
-    def _build_files_section(self, files: List[Dict]) -> str:
-        """Build HTML files section."""
-        if not files:
-            return ''
-
-        rows = []
-        for f in files[:100]:  # Limit to first 100 files
-            name = html.escape(f.get('name', 'Unknown'))
-            size = f.get('size', 0)
-            lines = f.get('line_count', 0)
-            rows.append(f'''
-            <tr>
-                <td>{name}</td>
-                <td>{lines:,}</td>
-                <td>{self._format_size(size)}</td>
-            </tr>''')
-
-        return f'''
+    def _files_section_parts(self, files: List[Dict[str, Any]]) -> Iterator[str]:
+        """Yield the HTML files section."""
+        yield '''
         <div class="section">
             <h2>Files Analyzed</h2>
             <table>
@@ -248,101 +382,110 @@ class ReportGenerator:
                     </tr>
                 </thead>
                 <tbody>
-                    {''.join(rows)}
+                    '''
+        escape = html.escape  # C-level str.replace passes; faster than str.translate here
+        format_size = _format_size
+        for f in files[:100]:  # Limit to first 100 files
+            name = escape(f.get('name', 'Unknown'))
+            size = f.get('size', 0)
+            lines = f.get('line_count', 0)
+            yield f'''
+            <tr>
+                <td>{name}</td>
+                <td>{lines:,}</td>
+                <td>{format_size(size)}</td>
+            </tr>'''
+        yield '''
                 </tbody>
             </table>
         </div>'''
 
     def _build_markdown(self, data: Dict[str, Any]) -> str:
         """Build Markdown content."""
+        return ''.join(self._iter_markdown(data))
+
+    def _iter_markdown(self, data: Dict[str, Any]) -> Iterator[str]:
+        """Yield the Markdown report as fragments, in document order."""
         stats = data.get('statistics', {})
         files = data.get('files', [])
 
-        lines = [
-            f"# {self.title}",
-            "",
-            f"**Generated:** {self.generated_at.strftime('%Y-%m-%d %H:%M:%S')}",
-            "",
-            "## Summary Statistics",
-            "",
-            "| Metric | Value |",
-            "|--------|-------|"
-        ]
+        yield (
+            f"# {self.title}\n"
+            "\n"
+            f"**Generated:** {self._generated_str}\n"
+            "\n"
+            "## Summary Statistics\n"
+            "\n"
+            "| Metric | Value |\n"
+            "|--------|-------|\n"
+        )
 
-        for key, value in stats.items():
-            if isinstance(value, (int, float)):
-                lines.append(f"| {key.replace('_', ' ').title()} | {value:,} |")
+        for label, value in self._stat_rows(stats):
+            yield f"| {label} | {value} |\n"
 
         if files:
-            lines.extend([
-                "",
-                "## Files Analyzed",
-                "",
-                "| File | Lines | Size |",
-                "|------|-------|------|"
-            ])
-
+            yield (
+                "\n"
+                "## Files Analyzed\n"
+                "\n"
+                "| File | Lines | Size |\n"
+                "|------|-------|------|\n"
+            )
+
+            format_size = _format_size
             for f in files[:50]:
                 name = f.get('name', 'Unknown')
                 line_count = f.get('line_count', 0)
-                size = self._format_size(f.get('size', 0))
-                lines.append(f"| {name} | {line_count:,} | {size} |")
+                size = format_size(f.get('size', 0))
+                yield f"| {name} | {line_count:,} | {size} |\n"
 
-        lines.extend([
-            "",
-            "---",
+        yield (
+            "\n"
+            "---\n"
             "*Generated by CodeExtractPro*"
-        ])
-
-        return '\n'.join(lines)
+        )
 
     def _build_text(self, data: Dict[str, Any]) -> str:
         """Build plain text content."""
+        return ''.join(self._iter_text(data))
+
+    def _iter_text(self, data: Dict[str, Any]) -> Iterator[str]:
+        """Yield the plain text report as fragments, in document order."""
         stats = data.get('statistics', {})
         files = data.get('files', [])
-
-        lines = [
-            "=" * 80,
-            f" {self.title}",
-            "=" * 80,
-            f"Generated: {self.generated_at.strftime('%Y-%m-%d %H:%M:%S')}",
-            "",
-            "-" * 40,
-            "SUMMARY STATISTICS",
-            "-" * 40,
-        ]
-
-        for key, value in stats.items():
-            if isinstance(value, (int, float)):
-                label = key.replace('_', ' ').title()
-                lines.append(f"  {label}: {value:,}")
+        rule = "-" * 40
+        banner = "=" * 80
+
+        yield (
+            f"{banner}\n"
+            f" {self.title}\n"
+            f"{banner}\n"
+            f"Generated: {self._generated_str}\n"
+            "\n"
+            f"{rule}\n"
+            "SUMMARY STATISTICS\n"
+            f"{rule}\n"
+        )
+
+        for label, value in self._stat_rows(stats):
+            yield f"  {label}: {value}\n"
 
         if files:
-            lines.extend([
-                "",
-                "-" * 40,
-                "FILES ANALYZED",
-                "-" * 40,
-            ])
+            yield f"\n{rule}\nFILES ANALYZED\n{rule}\n"
 
             for f in files[:50]:
                 name = f.get('name', 'Unknown')
                 line_count = f.get('line_count', 0)
-                lines.append(f"  - {name} ({line_count:,} lines)")
-
-        lines.extend([
-            "",
-            "=" * 80,
-            "Generated by CodeExtractPro",
-            "=" * 80
-        ])
-
-        return '\n'.join(lines)
-
-    def _format_size(self, size: int) -> str:
-        """Format size to human-readable string."""
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size < 1024:
-                return f"{size:.1f} {unit}" if unit != 'B' else f"{size} {unit}"
-            size /= 1024
-        return f"{size:.1f} TB"
+                yield f"  - {name} ({line_count:,} lines)\n"
+
+        yield (
+            "\n"
+            f"{banner}\n"
+            "Generated by CodeExtractPro\n"
+            f"{banner}"
+        )
+
+    def _stat_rows(self, stats: Dict[str, Any]) -> List[Tuple[str, str]]:
+        """Return (label, formatted value) pairs for the numeric statistics."""
+        return [(key.replace('_', ' ').title(), f"{value:,}")
+                for key, value in stats.items() if isinstance(value, (int, float))]
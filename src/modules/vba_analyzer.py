@@ -6,6 +6,9 @@ Provides matplotlib/seaborn visualizations and pandas DataFrame export.
 
 import re
 import os
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -35,6 +38,41 @@ try:
 except ImportError:
     pass
 
+# Optional RE2 engine: linear-time matching that releases the GIL
+RE2_AVAILABLE = False
+
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    pass
+
+
+# Whitespace within a line. Used instead of \s so that a pattern matches
+# the same text whether it is applied to one line or scanned over a module.
+_S = r'[^\S\n]'
+
+# A line's indentation, matched atomically: the lookahead captures all of it
+# and the backreference consumes it, so when the rest of a line fails to
+# match, the engine does not retry every shorter indentation.
+_INDENT = rf'(?=({_S}*))\1'
+
+# First letters of the keywords that can start a scanned line (Const, Dim,
+# End, Friend, Function, Global, Private, Property, Public, Static, Sub).
+# Any other line is rejected before the scan tries a single alternative.
+_KEYWORD_START = r'(?=[cdefgps])'
+
+
+def _compile(source: str, use_re2: bool = False):
+    """Compile a case-insensitive, multiline pattern, with RE2 if requested and available."""
+    if use_re2 and RE2_AVAILABLE:
+        try:
+            # RE2's \w is ASCII-only; VBA identifiers may hold accented letters
+            return re2.compile('(?im)' + source.replace(r'\w', r'[\pL\pN_]'))
+        except re2.error:
+            pass
+    return re.compile(source, re.IGNORECASE | re.MULTILINE)
+
 
 class VBAElementType(Enum):
     """Types of VBA elements."""
@@ -56,7 +94,7 @@ class VBAScope(Enum):
     STATIC = "Static"
 
 
-@dataclass
+@dataclass(slots=True)
 class VBAProcedure:
     """Represents a VBA procedure (Sub, Function, Property)."""
     name: str
@@ -81,7 +119,7 @@ class VBAProcedure:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class VBAVariable:
     """Represents a VBA variable or constant."""
     name: str
@@ -108,7 +146,7 @@ class VBAVariable:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class VBAAnalysisResult:
     """Result of VBA code analysis."""
     success: bool
@@ -151,62 +189,89 @@ class VBAAnalyzer:
     Extracts procedures, variables, constants with full scope information.
     """
 
-    def __init__(self):
-        # Regex patterns for VBA code analysis
-        self.patterns = {
+    # Columns of the DataFrame built by to_dataframe, in order
+    DATAFRAME_COLUMNS = (
+        'Classeur', 'Module', 'Type_Module', 'Procedure', 'Type_Procedure',
+        'Scope_Procedure', 'Declaration', 'Nom_Variable', 'Type_Variable',
+        'Valeur', 'Ligne', 'Code_Source'
+    )
+    # Below this much source text in total, process start-up in analyze_many
+    # costs more than scanning the modules in this process
+    PROCESS_POOL_MIN_CHARS = 1_000_000
+
+    # Low-cardinality text columns, stored as pandas categories
+    CATEGORICAL_COLUMNS = (
+        'Classeur', 'Module', 'Type_Module', 'Type_Procedure', 'Scope_Procedure',
+        'Declaration', 'Type_Variable'
+    )
+
+    def __init__(self, use_re2: bool = False):
+        # use_re2 compiles the patterns with RE2 when google-re2 is installed:
+        # linear-time matching for untrusted code, but slower than re here
+        self.use_re2 = use_re2
+
+        # Regex patterns for VBA code analysis, each applied after a line's
+        # indentation. Whitespace is written as _S so no pattern can run past
+        # a line break when scanning a whole module.
+        sources = {
             # Procedures: Sub, Function, Property Get/Let/Set
-            'procedure': re.compile(
-                r'^\s*(Public|Private|Friend)?\s*'
-                r'(Sub|Function|Property\s+(?:Get|Let|Set))\s+'
-                r'(\w+)\s*'
-                r'\(([^)]*)\)'
-                r'(?:\s+As\s+(\w+))?',
-                re.IGNORECASE | re.MULTILINE
+            'procedure': (
+                rf'(Public|Private|Friend)?{_S}*'
+                rf'(Sub|Function|Property{_S}+(?:Get|Let|Set)){_S}+'
+                rf'(\w+){_S}*'
+                r'\(([^)\n]*)\)'
+                rf'(?:{_S}+As{_S}+(\w+))?'
             ),
+            # End of a procedure: End Sub/Function/Property
+            'proc_end': rf'End{_S}+(Sub|Function|Property)',
             # Variables with type: Dim/Private/Public/Global/Static variable As Type
-            'variable': re.compile(
-                r'^\s*(Dim|Private|Public|Global|Static)\s+'
-                r'(\w+(?:\s*,\s*\w+)*)\s+'
-                r'As\s+(\w+(?:\([^)]*\))?)',
-                re.IGNORECASE | re.MULTILINE
+            'variable': (
+                rf'(Dim|Private|Public|Global|Static){_S}+'
+                rf'(\w+(?:{_S}*,{_S}*\w+)*){_S}+'
+                rf'As{_S}+(\w+(?:\([^)\n]*\))?)'
             ),
             # Constants with value: Const NAME As Type = Value
-            'const_value': re.compile(
-                r'^\s*(Public|Private)?\s*Const\s+'
-                r'(\w+)\s+'
-                r'As\s+(\w+)\s*=\s*(.+)$',
-                re.IGNORECASE | re.MULTILINE
+            'const_value': (
+                rf'(Public|Private)?{_S}*Const{_S}+'
+                rf'(\w+){_S}+'
+                rf'As{_S}+(\w+){_S}*={_S}*(.+)$'
             ),
             # Simple constants without type: Const NAME = Value
-            'const_simple': re.compile(
-                r'^\s*(Public|Private)?\s*Const\s+'
-                r'(\w+)\s*=\s*(.+)$',
-                re.IGNORECASE | re.MULTILINE
+            'const_simple': (
+                rf'(Public|Private)?{_S}*Const{_S}+'
+                rf'(\w+){_S}*={_S}*(.+)$'
             ),
             # Type definitions
-            'type_def': re.compile(
-                r'^\s*(Public|Private)?\s*Type\s+(\w+)',
-                re.IGNORECASE | re.MULTILINE
-            ),
+            'type_def': rf'(Public|Private)?{_S}*Type{_S}+(\w+)',
             # Enum definitions
-            'enum_def': re.compile(
-                r'^\s*(Public|Private)?\s*Enum\s+(\w+)',
-                re.IGNORECASE | re.MULTILINE
-            ),
+            'enum_def': rf'(Public|Private)?{_S}*Enum{_S}+(\w+)',
             # API declarations
-            'api_declare': re.compile(
-                r'^\s*(Public|Private)?\s*Declare\s+'
-                r'(PtrSafe\s+)?(Sub|Function)\s+'
-                r'(\w+)\s+Lib\s+"([^"]+)"',
-                re.IGNORECASE | re.MULTILINE
+            'api_declare': (
+                rf'(Public|Private)?{_S}*Declare{_S}+'
+                rf'(PtrSafe{_S}+)?(Sub|Function){_S}+'
+                rf'(\w+){_S}+Lib{_S}+"([^"\n]+)"'
             ),
             # Module-level Option statements
-            'option': re.compile(
-                r'^\s*Option\s+(Explicit|Base|Compare|Private)',
-                re.IGNORECASE | re.MULTILINE
-            )
+            'option': rf'Option{_S}+(Explicit|Base|Compare|Private)'
+        }
+        self.patterns = {
+            name: _compile(rf'^{_S}*{source}', use_re2) for name, source in sources.items()
         }
 
+        # One alternation over every line-level construct analyze_code needs,
+        # so a module is scanned once. Alternatives are tried in this order,
+        # after the indentation is consumed once for all of them and the
+        # first letter is checked. RE2 does not backtrack, and supports
+        # neither the backreference nor the lookahead.
+        if use_re2 and RE2_AVAILABLE:
+            line_start = rf'^{_S}*'
+        else:
+            line_start = f'^{_INDENT}{_KEYWORD_START}'
+        self._scan_pattern = _compile(f'{line_start}(?:' + '|'.join(
+            f'(?P<{name}>{sources[name]})'
+            for name in ('proc_end', 'procedure', 'const_value', 'const_simple', 'variable')
+        ) + ')', use_re2)
+
         # Module types mapping
         self.module_types = {
             1: "Module Standard",
@@ -228,13 +293,12 @@ class VBAAnalyzer:
         Returns:
             VBAAnalysisResult with extracted procedures and variables
         """
-        start_time = datetime.now()
+        start_time = time.perf_counter()
 
         try:
-            procedures = self._extract_procedures(code, module_name)
-            variables = self._extract_variables(code, module_name, procedures)
+            procedures, variables = self._scan_code(code, module_name)
 
-            analysis_time = (datetime.now() - start_time).total_seconds()
+            analysis_time = time.perf_counter() - start_time
 
             return VBAAnalysisResult(
                 success=True,
@@ -253,102 +317,99 @@ class VBAAnalyzer:
                 error_message=str(e)
             )
 
-    def _extract_procedures(self, code: str, module_name: str) -> List[VBAProcedure]:
-        """Extract all procedures from VBA code."""
-        procedures = []
-        lines = code.split('\n')
+    def analyze_many(self, modules: List[Tuple[str, str, str]],
+                     max_workers: Optional[int] = None) -> List[VBAAnalysisResult]:
+        """
+        Analyze several VBA modules, in worker processes when there is enough code.
 
-        for i, line in enumerate(lines, 1):
-            match = self.patterns['procedure'].match(line)
-            if match:
-                scope = match.group(1) or "Public"
-                proc_type = match.group(2)
-                proc_name = match.group(3)
-                params = match.group(4) or ""
-                return_type = match.group(5)
+        Args:
+            modules: (code, module_name, source_file) tuples
+            max_workers: Worker process count (defaults to the CPU count)
+
+        Returns:
+            One VBAAnalysisResult per module, in input order
+        """
+        if sum(len(code) for code, _, _ in modules) < self.PROCESS_POOL_MIN_CHARS:
+            return [self.analyze_code(*module) for module in modules]
+
+        # Regex scanning is CPU-bound, so modules go to worker processes to
+        # sidestep the GIL
+        codes, module_names, source_files = zip(*modules, strict=True)
+        workers = max_workers or os.cpu_count() or 1
+        chunksize = max(1, len(modules) // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_analyze_code_worker, codes, module_names, source_files,
+                                     [self.use_re2] * len(modules), chunksize=chunksize))
+
+    def _scan_code(self, code: str, module_name: str
+                   ) -> Tuple[List[VBAProcedure], List[VBAVariable]]:
+        """Extract procedures, variables and constants in one regex pass."""
+        procedures: List[VBAProcedure] = []
+        variables: List[VBAVariable] = []
+        current_procedure = None
+        group_index = self._scan_pattern.groupindex
+        line_number = 1
+        pos = 0
+
+        for match in self._scan_pattern.finditer(code):
+            # Every alternative is anchored at a line start
+            start = match.start()
+            line_number += code.count('\n', pos, start)
+            pos = start
+
+            kind = match.lastgroup
+            if kind == 'proc_end':
+                current_procedure = None
+                continue
 
+            end = code.find('\n', start)
+            line = code[start:end] if end != -1 else code[start:]
+            # Groups of an alternative follow its named group
+            base = group_index[kind]
+            groups = match.groups()[base:base + 5]
+
+            if kind == 'procedure':
+                scope, proc_type, current_procedure, params, return_type = groups
                 procedures.append(VBAProcedure(
-                    name=proc_name,
+                    name=current_procedure,
                     procedure_type=proc_type,
-                    scope=scope,
-                    parameters=params.strip(),
+                    scope=scope or "Public",
+                    parameters=(params or "").strip(),
                     return_type=return_type,
                     module_name=module_name,
-                    line_number=i,
+                    line_number=line_number,
                     signature=line.strip()
                 ))
 
-        return procedures
-
-    def _extract_variables(self, code: str, module_name: str,
-                           procedures: List[VBAProcedure]) -> List[VBAVariable]:
-        """Extract all variables and constants from VBA code."""
-        variables = []
-        lines = code.split('\n')
-        current_procedure = None
-
-        for i, line in enumerate(lines, 1):
-            # Track current procedure
-            for proc in procedures:
-                if proc.line_number == i:
-                    current_procedure = proc.name
-                    break
-
-            # Check for procedure end
-            if re.match(r'^\s*End\s+(Sub|Function|Property)', line, re.IGNORECASE):
-                current_procedure = None
-                continue
-
-            # Extract constants with type and value
-            const_match = self.patterns['const_value'].match(line)
-            if const_match:
-                scope = const_match.group(1) or ("Private" if current_procedure else "Public")
-                const_name = const_match.group(2)
-                const_type = const_match.group(3)
-                const_value = const_match.group(4).strip()
-
+            elif kind == 'const_value':
+                # Constants with type and value
                 variables.append(VBAVariable(
-                    name=const_name,
-                    var_type=const_type,
+                    name=groups[1],
+                    var_type=groups[2],
                     declaration="Const",
-                    scope=scope,
-                    value=const_value,
+                    scope=groups[0] or ("Private" if current_procedure else "Public"),
+                    value=groups[3].strip(),
                     module_name=module_name,
                     procedure_name=current_procedure,
-                    line_number=i,
+                    line_number=line_number,
                     source=line.strip()
                 ))
-                continue
-
-            # Extract simple constants
-            simple_const = self.patterns['const_simple'].match(line)
-            if simple_const and not const_match:
-                scope = simple_const.group(1) or ("Private" if current_procedure else "Public")
-                const_name = simple_const.group(2)
-                const_value = simple_const.group(3).strip()
 
+            elif kind == 'const_simple':
                 variables.append(VBAVariable(
-                    name=const_name,
+                    name=groups[1],
                     var_type="Variant",
                     declaration="Const",
-                    scope=scope,
-                    value=const_value,
+                    scope=groups[0] or ("Private" if current_procedure else "Public"),
+                    value=groups[2].strip(),
                     module_name=module_name,
                     procedure_name=current_procedure,
-                    line_number=i,
+                    line_number=line_number,
                     source=line.strip()
                 ))
-                continue
 
-            # Extract variables
-            var_match = self.patterns['variable'].match(line)
-            if var_match:
-                declaration = var_match.group(1)
-                var_names_str = var_match.group(2)
-                var_type = var_match.group(3)
-
-                # Handle multiple variables on same line
-                var_names = [n.strip() for n in var_names_str.split(',')]
+            else:
+                declaration, names, var_type = groups[:3]
 
                 # Determine scope
                 if declaration in ('Private', 'Public', 'Global'):
@@ -358,20 +419,55 @@ class VBAAnalyzer:
                 else:
                     scope = "Module"
 
-                for var_name in var_names:
+                # Handle multiple variables on same line
+                source = line.strip()
+                for var_name in names.split(','):
                     variables.append(VBAVariable(
-                        name=var_name,
+                        name=var_name.strip(),
                         var_type=var_type,
                         declaration=declaration,
                         scope=scope,
                         value=None,
                         module_name=module_name,
                         procedure_name=current_procedure,
-                        line_number=i,
-                        source=line.strip()
+                        line_number=line_number,
+                        source=source
                     ))
 
-        return variables
+        return procedures, variables
+
+    def _build_columns(self, results: List[VBAAnalysisResult]) -> Dict[str, List[Any]]:
+        """Tabulate results column by column: procedures, then variables, per result."""
+        columns: Dict[str, List[Any]] = {name: [] for name in self.DATAFRAME_COLUMNS}
+
+        for result in results:
+            procedures = result.procedures
+            variables = result.variables
+            count = len(procedures) + len(variables)
+
+            columns['Classeur'] += [result.source_file] * count
+            columns['Module'] += [result.module_name] * count
+            columns['Type_Module'] += [''] * count
+            columns['Procedure'] += [proc.name for proc in procedures]
+            columns['Procedure'] += [var.procedure_name or '' for var in variables]
+            columns['Type_Procedure'] += [proc.procedure_type for proc in procedures]
+            columns['Type_Procedure'] += [''] * len(variables)
+            columns['Scope_Procedure'] += [proc.scope for proc in procedures]
+            columns['Scope_Procedure'] += [''] * len(variables)
+            columns['Declaration'] += ['Procedure'] * len(procedures)
+            columns['Declaration'] += [var.declaration for var in variables]
+            columns['Nom_Variable'] += [''] * len(procedures)
+            columns['Nom_Variable'] += [var.name for var in variables]
+            columns['Type_Variable'] += [proc.return_type or '' for proc in procedures]
+            columns['Type_Variable'] += [var.var_type for var in variables]
+            columns['Valeur'] += [''] * len(procedures)
+            columns['Valeur'] += [var.value or '' for var in variables]
+            columns['Ligne'] += [proc.line_number for proc in procedures]
+            columns['Ligne'] += [var.line_number for var in variables]
+            columns['Code_Source'] += [proc.signature for proc in procedures]
+            columns['Code_Source'] += [var.source for var in variables]
+
+        return columns
 
     def to_dataframe(self, results: List[VBAAnalysisResult]) -> Optional['pd.DataFrame']:
         """
@@ -381,49 +477,14 @@ class VBAAnalyzer:
             results: List of VBAAnalysisResult objects
 
         Returns:
-            DataFrame with all extracted elements, or None if pandas unavailable
+            DataFrame with all extracted elements, or None if pandas unavailable.
+            Columns listed in CATEGORICAL_COLUMNS have the category dtype.
         """
         if not PANDAS_AVAILABLE:
             return None
 
-        data = []
-
-        for result in results:
-            # Add procedures
-            for proc in result.procedures:
-                data.append({
-                    'Classeur': result.source_file,
-                    'Module': result.module_name,
-                    'Type_Module': '',
-                    'Procedure': proc.name,
-                    'Type_Procedure': proc.procedure_type,
-                    'Scope_Procedure': proc.scope,
-                    'Declaration': 'Procedure',
-                    'Nom_Variable': '',
-                    'Type_Variable': proc.return_type or '',
-                    'Valeur': '',
-                    'Ligne': proc.line_number,
-                    'Code_Source': proc.signature
-                })
-
-            # Add variables
-            for var in result.variables:
-                data.append({
-                    'Classeur': result.source_file,
-                    'Module': result.module_name,
-                    'Type_Module': '',
-                    'Procedure': var.procedure_name or '',
-                    'Type_Procedure': '',
-                    'Scope_Procedure': '',
-                    'Declaration': var.declaration,
-                    'Nom_Variable': var.name,
-                    'Type_Variable': var.var_type,
-                    'Valeur': var.value or '',
-                    'Ligne': var.line_number,
-                    'Code_Source': var.source
-                })
-
-        return pd.DataFrame(data)
+        columns = self._build_columns(results)
+        return pd.DataFrame(columns).astype(dict.fromkeys(self.CATEGORICAL_COLUMNS, 'category'))
 
     def export_to_excel(self, results: List[VBAAnalysisResult], output_path: str) -> bool:
         """
@@ -436,15 +497,24 @@ class VBAAnalyzer:
         Returns:
             True if successful
         """
-        if not PANDAS_AVAILABLE:
+        try:
+            import openpyxl
+        except ImportError:
             return False
 
         try:
-            df = self.to_dataframe(results)
-            if df is None or df.empty:
+            columns = self._build_columns(results)
+            if not columns['Ligne']:
                 return False
 
-            df.to_excel(output_path, index=False, sheet_name="Analyse_VBA")
+            # Write-only workbooks stream rows to disk instead of keeping
+            # a Cell object per value in memory
+            wb = openpyxl.Workbook(write_only=True)
+            ws = wb.create_sheet("Analyse_VBA")
+            ws.append(self.DATAFRAME_COLUMNS)
+            for row in zip(*columns.values(), strict=True):
+                ws.append(row)
+            wb.save(output_path)
             return True
 
         except Exception:
@@ -464,6 +534,10 @@ class VBAAnalyzer:
             'procedures_per_module': {},
             'variables_per_module': {}
         }
+        procedures_by_type = Counter()
+        procedures_by_scope = Counter()
+        variables_by_type = Counter()
+        variables_by_declaration = Counter()
 
         for result in results:
             stats['total_procedures'] += result.total_procedures
@@ -472,20 +546,23 @@ class VBAAnalyzer:
             stats['procedures_per_module'][result.module_name] = result.total_procedures
             stats['variables_per_module'][result.module_name] = result.total_variables
 
-            for proc in result.procedures:
-                proc_type = proc.procedure_type
-                stats['procedures_by_type'][proc_type] = stats['procedures_by_type'].get(proc_type, 0) + 1
-                stats['procedures_by_scope'][proc.scope] = stats['procedures_by_scope'].get(proc.scope, 0) + 1
+            procedures_by_type.update(proc.procedure_type for proc in result.procedures)
+            procedures_by_scope.update(proc.scope for proc in result.procedures)
+            variables_by_type.update(var.var_type for var in result.variables)
+            variables_by_declaration.update(var.declaration for var in result.variables)
 
-            for var in result.variables:
-                stats['variables_by_type'][var.var_type] = stats['variables_by_type'].get(var.var_type, 0) + 1
-                stats['variables_by_declaration'][var.declaration] = stats['variables_by_declaration'].get(var.declaration, 0) + 1
+        # Plain dicts for callers, in first-seen order as before
+        stats['procedures_by_type'] = dict(procedures_by_type)
+        stats['procedures_by_scope'] = dict(procedures_by_scope)
+        stats['variables_by_type'] = dict(variables_by_type)
+        stats['variables_by_declaration'] = dict(variables_by_declaration)
 
         return stats
 
     def plot_procedures_by_module(self, results: List[VBAAnalysisResult],
                                    output_path: Optional[str] = None,
-                                   figsize: Tuple[int, int] = (12, 6)) -> Optional[Any]:
+                                   figsize: Tuple[int, int] = (12, 6),
+                                   stats: Optional[Dict[str, Any]] = None) -> Optional[Any]:
         """
         Create bar chart of procedures per module.
 
@@ -493,6 +570,7 @@ class VBAAnalyzer:
             results: Analysis results
             output_path: Optional path to save the figure
             figsize: Figure size (width, height)
+            stats: Statistics already computed by generate_statistics(results)
 
         Returns:
             matplotlib figure or None if not available
@@ -500,7 +578,8 @@ class VBAAnalyzer:
         if not MATPLOTLIB_AVAILABLE:
             return None
 
-        stats = self.generate_statistics(results)
+        if stats is None:
+            stats = self.generate_statistics(results)
         proc_per_module = stats['procedures_per_module']
 
         if not proc_per_module:
@@ -531,7 +610,8 @@ class VBAAnalyzer:
 
     def plot_variables_by_type(self, results: List[VBAAnalysisResult],
                                 output_path: Optional[str] = None,
-                                figsize: Tuple[int, int] = (15, 6)) -> Optional[Any]:
+                                figsize: Tuple[int, int] = (15, 6),
+                                stats: Optional[Dict[str, Any]] = None) -> Optional[Any]:
         """
         Create charts for variables by type (bar + pie).
 
@@ -539,6 +619,7 @@ class VBAAnalyzer:
             results: Analysis results
             output_path: Optional path to save the figure
             figsize: Figure size
+            stats: Statistics already computed by generate_statistics(results)
 
         Returns:
             matplotlib figure or None
@@ -546,7 +627,8 @@ class VBAAnalyzer:
         if not MATPLOTLIB_AVAILABLE:
             return None
 
-        stats = self.generate_statistics(results)
+        if stats is None:
+            stats = self.generate_statistics(results)
         var_by_type = stats['variables_by_type']
         var_by_decl = stats['variables_by_declaration']
 
@@ -601,13 +683,9 @@ class VBAAnalyzer:
         if df is None or df.empty:
             return None
 
-        # Create pivot table
-        pivot_data = df.pivot_table(
-            index='Module',
-            columns='Declaration',
-            values='Nom_Variable',
-            aggfunc='count',
-            fill_value=0
+        # Count declarations per module (Module x Declaration table)
+        pivot_data = df.groupby(['Module', 'Declaration'], observed=True).size().unstack(
+            'Declaration', fill_value=0
         )
 
         if pivot_data.empty:
@@ -628,9 +706,21 @@ class VBAAnalyzer:
 
         return fig
 
-    def generate_report(self, results: List[VBAAnalysisResult]) -> str:
-        """Generate a text report of the analysis."""
-        stats = self.generate_statistics(results)
+    def generate_report(self, results: List[VBAAnalysisResult],
+                        stats: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Generate a text report of the analysis.
+
+        Args:
+            results: Analysis results
+            stats: Statistics already computed by generate_statistics(results),
+                   so callers that also plot need only one pass over the results
+
+        Returns:
+            Report text
+        """
+        if stats is None:
+            stats = self.generate_statistics(results)
 
         report = []
         report.append("=" * 80)
@@ -695,6 +785,27 @@ class VBAAnalyzer:
         return "\n".join(report)
 
 
+_worker_analyzers: Dict[bool, VBAAnalyzer] = {}
+
+
+def _analyze_code_worker(code: str, module_name: str, source_file: str,
+                         use_re2: bool) -> VBAAnalysisResult:
+    """
+    Process-pool entry point for VBAAnalyzer.analyze_many.
+
+    Module-level so only the code and names are pickled per task; each
+    worker process compiles its patterns once and reuses its analyzer.
+    """
+    analyzer = _worker_analyzers.get(use_re2)
+    if analyzer is None:
+        analyzer = _worker_analyzers[use_re2] = VBAAnalyzer(use_re2)
+    return analyzer.analyze_code(code, module_name, source_file)
+
+
+# Maps non-printable bytes to '.' for the ASCII column of hex dumps
+_ASCII_TABLE = bytes(b if 32 <= b < 127 else 0x2E for b in range(256))
+
+
 def get_hex_preview(file_path: str, max_bytes: int = 512) -> str:
     """
     Generate hexadecimal preview of a binary file.
@@ -708,6 +819,7 @@ def get_hex_preview(file_path: str, max_bytes: int = 512) -> str:
     """
     try:
         with open(file_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
             data = f.read(max_bytes)
 
         if not data:
@@ -715,29 +827,30 @@ def get_hex_preview(file_path: str, max_bytes: int = 512) -> str:
 
         lines = []
         lines.append(f"File: {os.path.basename(file_path)}")
-        lines.append(f"Size: {os.path.getsize(file_path)} bytes")
+        lines.append(f"Size: {size} bytes")
         lines.append(f"Preview: first {len(data)} bytes")
         lines.append("=" * 75)
         lines.append("")
         lines.append("Offset    00 01 02 03 04 05 06 07  08 09 0A 0B 0C 0D 0E 0F  ASCII")
         lines.append("-" * 75)
 
-        for i in range(0, len(data), 16):
-            chunk = data[i:i+16]
+        # Hex and printable ASCII for the whole preview, each in one C-level
+        # pass; every byte takes three characters ("XX ") in the hex string
+        hex_text = data.hex(' ').upper()
+        text = data.translate(_ASCII_TABLE).decode('ascii')
 
+        for i in range(0, len(data), 16):
             # Offset
             offset = f"{i:08X}"
 
             # Hex part
-            hex_left = ' '.join(f'{b:02X}' for b in chunk[:8])
-            hex_right = ' '.join(f'{b:02X}' for b in chunk[8:16])
+            start = i * 3
+            hex_left = hex_text[start:start+23]
+            hex_right = hex_text[start+24:start+47]
             hex_part = f"{hex_left:<23}  {hex_right:<23}"
 
             # ASCII part
-            ascii_part = ''.join(
-                chr(b) if 32 <= b < 127 else '.'
-                for b in chunk
-            )
+            ascii_part = text[i:i+16]
 
             lines.append(f"{offset}  {hex_part}  {ascii_part}")
 
@@ -751,6 +864,10 @@ def get_hex_preview(file_path: str, max_bytes: int = 512) -> str:
         return f"Error reading file: {e}"
 
 
+# Byte values counted as text by is_binary_file
+_TEXT_BYTES = bytes(sorted({7, 8, 9, 10, 12, 13, 27} | set(range(0x20, 0x100)) - {0x7f}))
+
+
 def is_binary_file(file_path: str, sample_size: int = 8192) -> bool:
     """
     Check if a file is binary by examining its content.
@@ -774,8 +891,7 @@ def is_binary_file(file_path: str, sample_size: int = 8192) -> bool:
             return True
 
         # Check ratio of non-text characters
-        text_chars = bytearray({7, 8, 9, 10, 12, 13, 27} | set(range(0x20, 0x100)) - {0x7f})
-        non_text = sum(1 for b in chunk if b not in text_chars)
+        non_text = len(chunk.translate(None, _TEXT_BYTES))
 
         return non_text / len(chunk) > 0.30
 
@@ -3,15 +3,20 @@ VBA Extractor Module - Extract VBA code from Office files.
 Supports Excel, Word, and PowerPoint files with multiple extraction methods.
 """
 
+import logging
 import os
+import struct
 import sys
 import tempfile
 import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, ClassVar, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from enum import Enum
+from itertools import repeat
 
 # Optional imports with graceful fallback
 OLETOOLS_AVAILABLE = False
@@ -23,12 +28,64 @@ try:
 except ImportError:
     pass
 
+# Direct access to the VBA projects inside OOXML containers, skipping the
+# VBA_Parser container analysis (olefile ships with oletools). _extract_vba
+# is private to olevba, hence the oletools version range in requirements.txt.
+OLE_DIRECT_AVAILABLE = False
+
+try:
+    import olefile
+    from oletools.olevba import OlevbaBaseException, _extract_vba
+    OLE_DIRECT_AVAILABLE = True
+except ImportError:
+    pass
+
 try:
+    import pythoncom
     import win32com.client
     WIN32COM_AVAILABLE = True
 except ImportError:
     pass
 
+logger = logging.getLogger(__name__)
+
+# Errors of a malformed or unreadable VBA project or OOXML package, left to
+# VBA_Parser
+_DIRECT_READ_ERRORS: Tuple[type, ...] = (
+    OSError, ValueError, IndexError, struct.error, zipfile.BadZipFile, KeyError,
+)
+if OLE_DIRECT_AVAILABLE:
+    _DIRECT_READ_ERRORS += (OlevbaBaseException,)
+
+
+def _find_vba_projects(ole: 'olefile.OleFileIO') -> List[Tuple[str, str, str]]:
+    """
+    Find the VBA projects in an OLE file, as VBA_Parser.find_vba_projects does.
+
+    A project root is a storage holding a PROJECT stream and a VBA storage
+    with _VBA_PROJECT and dir streams (MS-OVBA 2.2.1).
+
+    Returns:
+        (vba_root, project_path, dir_path) tuples for _extract_vba
+    """
+    projects = []
+    for storage in ole.listdir(streams=False, storages=True):
+        if storage[-1].upper() != 'VBA':
+            continue
+        vba_root = '/'.join(storage[:-1])
+        if vba_root:
+            vba_root += '/'
+
+        paths = [vba_root + name for name in ('PROJECT', 'VBA/_VBA_PROJECT', 'VBA/dir')]
+        if all(ole.exists(path) and ole.get_type(path) == olefile.STGTY_STREAM for path in paths):
+            projects.append((vba_root, paths[0], paths[2]))
+    return projects
+
+
+def _extension(file_path: str) -> str:
+    """Lowercase extension of a path, e.g. '.xlsm'."""
+    return os.path.splitext(file_path)[1].lower()
+
 
 class ExtractionMethod(Enum):
     """Available extraction methods."""
@@ -47,18 +104,20 @@ class VBAModule:
     stream_path: str = ""
     attributes: Dict[str, str] = field(default_factory=dict)
 
+    # File extension by module type
+    EXTENSIONS: ClassVar[Dict[str, str]] = {
+        "Module standard": "bas",
+        "Module": "bas",
+        "Classe": "cls",
+        "Module de Classe": "cls",
+        "UserForm": "frm",
+        "Document": "cls",
+    }
+
     @property
     def extension(self) -> str:
         """Get the appropriate file extension."""
-        type_map = {
-            "Module standard": "bas",
-            "Module": "bas",
-            "Classe": "cls",
-            "Module de Classe": "cls",
-            "UserForm": "frm",
-            "Document": "cls",
-        }
-        return type_map.get(self.module_type, "txt")
+        return self.EXTENSIONS.get(self.module_type, "txt")
 
     @property
     def line_count(self) -> int:
@@ -91,11 +150,23 @@ class VBAExtractor:
     Supports multiple extraction methods with automatic fallback.
     """
 
-    SUPPORTED_EXTENSIONS = {
-        '.xlsm', '.xlsb', '.xls', '.xla', '.xlam',  # Excel
-        '.docm', '.doc', '.dotm',                    # Word
-        '.pptm', '.ppt', '.potm', '.ppsm',          # PowerPoint
-    }
+    EXCEL_EXTENSIONS = frozenset({'.xlsm', '.xlsb', '.xls', '.xla', '.xlam'})
+    WORD_EXTENSIONS = frozenset({'.docm', '.doc', '.dotm'})
+    POWERPOINT_EXTENSIONS = frozenset({'.pptm', '.ppt', '.potm', '.ppsm'})
+
+    SUPPORTED_EXTENSIONS = EXCEL_EXTENSIONS | WORD_EXTENSIONS | POWERPOINT_EXTENSIONS
+
+    # Zip-based formats whose VBA projects are read directly from the archive
+    OOXML_EXTENSIONS = frozenset({
+        '.xlsm', '.xlam', '.docm', '.dotm', '.pptm', '.potm', '.ppsm',
+    })
+
+    # Leading bytes of zip packages (OOXML) and OLE2 compound files
+    ZIP_MAGIC = b'PK\x03\x04'
+    OLE_MAGIC = b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'
+
+    # Office applications that never start a second instance
+    SINGLE_INSTANCE_APPLICATIONS = frozenset({'PowerPoint.Application'})
 
     MODULE_TYPES = {
         1: "Module standard",
@@ -106,6 +177,9 @@ class VBAExtractor:
 
     def __init__(self, preferred_method: ExtractionMethod = ExtractionMethod.AUTO):
         self.preferred_method = preferred_method
+        # Office applications kept open by office_session(), keyed by ProgID,
+        # with whether the session launched them
+        self._session_apps: Optional[Dict[str, Tuple[Any, bool]]] = None
         self._check_dependencies()
 
     def _check_dependencies(self) -> Dict[str, bool]:
@@ -130,8 +204,7 @@ class VBAExtractor:
 
     def is_supported_file(self, file_path: str) -> bool:
         """Check if file type is supported."""
-        ext = Path(file_path).suffix.lower()
-        return ext in self.SUPPORTED_EXTENSIONS
+        return _extension(file_path) in self.SUPPORTED_EXTENSIONS
 
     def extract(self, file_path: str, output_dir: Optional[str] = None,
                 create_individual_files: bool = True,
@@ -176,6 +249,25 @@ class VBAExtractor:
         # Extract VBA code
         try:
             if method == "win32com":
+                # Only launch Office for a compound file or a package with a
+                # VBA project part; anything else is misnamed, truncated or
+                # has nothing for Office to expose (and may raise a repair prompt)
+                container = self._sniff_format(file_path)
+                if container is None:
+                    return ExtractionResult(
+                        success=False,
+                        source_file=file_path,
+                        method_used=method,
+                        error_message=f"Not an Office document: {Path(file_path).name}"
+                    )
+                if container == "ooxml" and not self._has_vba_project_part(file_path):
+                    return ExtractionResult(
+                        success=False,
+                        source_file=file_path,
+                        method_used=method,
+                        error_message="No VBA code found in file"
+                    )
+
                 modules = self._extract_with_win32com(file_path)
             else:
                 modules = self._extract_with_oletools(file_path)
@@ -215,6 +307,123 @@ class VBAExtractor:
                 error_message=str(e)
             )
 
+    def extract_many(self, file_paths: List[str], output_dir: Optional[str] = None,
+                     create_individual_files: bool = True,
+                     create_concatenated_file: bool = True,
+                     max_workers: Optional[int] = None) -> List[ExtractionResult]:
+        """
+        Extract VBA code from several Office files.
+
+        Parser-based extraction runs in worker processes. Office automation
+        runs in this process, one file after another in a single office
+        session: workers would share the single-instance Office servers, and
+        one worker quitting an application would break the others.
+
+        Args:
+            file_paths: Paths to the Office files
+            output_dir: Directory to save extracted files
+            create_individual_files: Create separate files for each module
+            create_concatenated_file: Create a single file with all code
+            max_workers: Worker process count (defaults to the CPU count)
+
+        Returns:
+            One ExtractionResult per file, in input order
+        """
+        if len(file_paths) < 2 or self._select_method() == "win32com":
+            with self.office_session():
+                return [self.extract(path, output_dir, create_individual_files, create_concatenated_file)
+                        for path in file_paths]
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(
+                _extract_file_worker, file_paths, repeat(self.preferred_method),
+                repeat(output_dir), repeat(create_individual_files), repeat(create_concatenated_file)
+            ))
+
+    def extract_batch_win32com(self, file_paths: List[str]) -> List[List[VBAModule]]:
+        """
+        Extract VBA from several Office files, sharing one application per format.
+
+        Args:
+            file_paths: Paths to the Office files
+
+        Returns:
+            The modules of each file, in input order
+        """
+        with self.office_session():
+            return [self._extract_with_win32com(path) for path in file_paths]
+
+    @contextmanager
+    def office_session(self) -> Iterator['VBAExtractor']:
+        """
+        Keep Office applications open across extractions until the block exits.
+
+        Nested sessions share the outermost one. On exit, only the applications
+        the session launched are quit; an instance the user already had open
+        is left running.
+        """
+        if self._session_apps is not None:
+            yield self
+            return
+
+        self._session_apps = {}
+        try:
+            yield self
+        finally:
+            apps, self._session_apps = self._session_apps, None
+            for app, owned in apps.values():
+                if not owned:
+                    continue
+                try:
+                    app.Quit()
+                except Exception:
+                    pass
+
+    def _open_application(self, prog_id: str) -> Any:
+        """Get the session's instance of an Office application, launching it if needed."""
+        if prog_id not in self._session_apps:
+            self._session_apps[prog_id] = self._launch_application(prog_id)
+        return self._session_apps[prog_id][0]
+
+    def _launch_application(self, prog_id: str) -> Tuple[Any, bool]:
+        """
+        Start an instance of an Office application for this extractor.
+
+        DispatchEx starts a new Excel or Word process rather than attaching to
+        the one the user has open. PowerPoint only ever runs one instance, so a
+        running one is borrowed instead.
+
+        Returns:
+            The application and whether this extractor launched it
+        """
+        if prog_id in self.SINGLE_INSTANCE_APPLICATIONS:
+            try:
+                return win32com.client.GetActiveObject(prog_id), False
+            except pythoncom.com_error:
+                pass  # Not running
+        return win32com.client.DispatchEx(prog_id), True
+
+    def _sniff_format(self, file_path: str) -> Optional[str]:
+        """
+        Identify the container format of a file from its first bytes.
+
+        Returns:
+            "ooxml" for zip packages, "ole2" for compound files, None otherwise
+        """
+        with open(file_path, 'rb') as f:
+            head = f.read(len(self.OLE_MAGIC))
+
+        if head.startswith(self.ZIP_MAGIC):
+            return "ooxml"
+        if head == self.OLE_MAGIC:
+            return "ole2"
+        return None
+
+    def _has_vba_project_part(self, file_path: str) -> bool:
+        """Check the zip directory of a package for a vbaProject.bin part."""
+        with zipfile.ZipFile(file_path) as archive:
+            return any(name.lower().endswith('vbaproject.bin') for name in archive.namelist())
+
     def _select_method(self) -> Optional[str]:
         """Select the best available extraction method."""
         if self.preferred_method == ExtractionMethod.WIN32COM:
@@ -232,79 +441,45 @@ class VBAExtractor:
 
     def _extract_with_win32com(self, file_path: str) -> List[VBAModule]:
         """Extract VBA using Win32COM automation. Supports Excel, Word, and PowerPoint."""
-        ext = Path(file_path).suffix.lower()
-
-        if ext in {'.xlsm', '.xlsb', '.xls', '.xla', '.xlam'}:
-            return self._extract_excel_win32com(file_path)
-        elif ext in {'.docm', '.doc', '.dotm'}:
-            return self._extract_word_win32com(file_path)
-        elif ext in {'.pptm', '.ppt', '.potm', '.ppsm'}:
-            return self._extract_powerpoint_win32com(file_path)
-        else:
-            return []
+        ext = _extension(file_path)
+
+        with self.office_session():
+            if ext in self.EXCEL_EXTENSIONS:
+                return self._extract_excel_win32com(file_path)
+            elif ext in self.WORD_EXTENSIONS:
+                return self._extract_word_win32com(file_path)
+            elif ext in self.POWERPOINT_EXTENSIONS:
+                return self._extract_powerpoint_win32com(file_path)
+            else:
+                return []
 
     def _extract_excel_win32com(self, file_path: str) -> List[VBAModule]:
         """Extract VBA from Excel files using Win32COM."""
-        modules = []
-        excel = None
-
-        try:
-            excel = win32com.client.Dispatch("Excel.Application")
-            excel.Visible = False
-            excel.DisplayAlerts = False
-
-            workbook = excel.Workbooks.Open(os.path.abspath(file_path))
+        excel = self._open_application("Excel.Application")
+        excel.Visible = False
+        excel.DisplayAlerts = False
 
-            try:
-                vb_project = workbook.VBProject
-
-                for component in vb_project.VBComponents:
-                    if component.CodeModule.CountOfLines > 0:
-                        code = component.CodeModule.Lines(1, component.CodeModule.CountOfLines)
-                        module_type = self.MODULE_TYPES.get(component.Type, "Unknown")
+        workbook = excel.Workbooks.Open(os.path.abspath(file_path))
 
-                        modules.append(VBAModule(
-                            name=component.Name,
-                            module_type=module_type,
-                            code=code,
-                            source_file=file_path
-                        ))
-
-            finally:
-                workbook.Close(SaveChanges=False)
+        try:
+            return self._enumerate_vb_project(workbook.VBProject, file_path)
 
         finally:
-            if excel:
-                excel.Quit()
-
-        return modules
+            workbook.Close(SaveChanges=False)
 
     def _extract_word_win32com(self, file_path: str) -> List[VBAModule]:
         """Extract VBA from Word files using Win32COM."""
         modules = []
-        word = None
 
         try:
-            word = win32com.client.Dispatch("Word.Application")
+            word = self._open_application("Word.Application")
             word.Visible = False
             word.DisplayAlerts = 0  # wdAlertsNone
 
             doc = word.Documents.Open(os.path.abspath(file_path), ReadOnly=True)
 
             try:
-                vb_project = doc.VBProject
-
-                for component in vb_project.VBComponents:
-                    if component.CodeModule.CountOfLines > 0:
-                        code = component.CodeModule.Lines(1, component.CodeModule.CountOfLines)
-                        module_type = self.MODULE_TYPES.get(component.Type, "Unknown")
-
-                        modules.append(VBAModule(
-                            name=component.Name,
-                            module_type=module_type,
-                            code=code,
-                            source_file=file_path
-                        ))
+                modules = self._enumerate_vb_project(doc.VBProject, file_path)
 
             finally:
                 doc.Close(SaveChanges=False)
@@ -313,19 +488,14 @@ class VBAExtractor:
             # Word may not have VBProject access enabled
             raise Exception(f"Word VBA extraction failed: {e}. Enable 'Trust access to VBA project' in Word options.")
 
-        finally:
-            if word:
-                word.Quit()
-
         return modules
 
     def _extract_powerpoint_win32com(self, file_path: str) -> List[VBAModule]:
         """Extract VBA from PowerPoint files using Win32COM."""
         modules = []
-        ppt = None
 
         try:
-            ppt = win32com.client.Dispatch("PowerPoint.Application")
+            ppt = self._open_application("PowerPoint.Application")
             # PowerPoint doesn't support Visible=False in some versions
             ppt.DisplayAlerts = 0  # ppAlertsNone
 
@@ -336,19 +506,7 @@ class VBAExtractor:
             )
 
             try:
-                vb_project = presentation.VBProject
-
-                for component in vb_project.VBComponents:
-                    if component.CodeModule.CountOfLines > 0:
-                        code = component.CodeModule.Lines(1, component.CodeModule.CountOfLines)
-                        module_type = self.MODULE_TYPES.get(component.Type, "Unknown")
-
-                        modules.append(VBAModule(
-                            name=component.Name,
-                            module_type=module_type,
-                            code=code,
-                            source_file=file_path
-                        ))
+                modules = self._enumerate_vb_project(presentation.VBProject, file_path)
 
             finally:
                 presentation.Close()
@@ -356,43 +514,132 @@ class VBAExtractor:
         except Exception as e:
             raise Exception(f"PowerPoint VBA extraction failed: {e}. Enable 'Trust access to VBA project' in PowerPoint options.")
 
-        finally:
-            if ppt:
-                ppt.Quit()
+        return modules
+
+    def _enumerate_vb_project(self, vb_project: Any, file_path: str) -> List[VBAModule]:
+        """Read the non-empty code modules of an open document's VBProject."""
+        modules = []
+
+        # Every property access is a COM round trip, so each one is read once
+        for component in vb_project.VBComponents:
+            code_module = component.CodeModule
+            line_count = code_module.CountOfLines
+            if line_count > 0:
+                code = code_module.Lines(1, line_count)
+                module_type = self.MODULE_TYPES.get(component.Type, "Unknown")
+
+                modules.append(VBAModule(
+                    name=component.Name,
+                    module_type=module_type,
+                    code=code,
+                    source_file=file_path
+                ))
 
         return modules
 
     def _extract_with_oletools(self, file_path: str) -> List[VBAModule]:
         """Extract VBA using oletools library."""
-        modules = []
+        if OLE_DIRECT_AVAILABLE:
+            # VBA_Parser remains the fallback when the direct read yields no
+            # code: it also recovers code from malformed projects and reads
+            # PowerPoint 97 and encrypted files
+            try:
+                if self._sniff_format(file_path) == "ole2":
+                    macros = self._read_ole_macros(file_path)
+                    if macros:
+                        return self._build_oletools_modules(file_path, macros)
+                elif (_extension(file_path) in self.OOXML_EXTENSIONS
+                        and zipfile.is_zipfile(file_path)):
+                    macros, has_ole_parts = self._read_ooxml_macros(file_path)
+                    if macros or not has_ole_parts:
+                        return self._build_oletools_modules(file_path, macros)
+            except _DIRECT_READ_ERRORS as e:
+                logger.warning("Direct VBA read of %s failed, falling back to VBA_Parser: %s", file_path, e)
 
         vba_parser = VBA_Parser(file_path)
         try:
-            if vba_parser.detect_vba_macros():
-                for (filename, stream_path, vba_filename, vba_code) in vba_parser.extract_macros():
-                    # Determine module type from code
-                    if "Attribute VB_PredeclaredId" in vba_code:
-                        module_type = "Classe/UserForm"
-                    elif vba_code.strip().startswith("Attribute VB_"):
-                        module_type = "Module"
-                    else:
-                        module_type = "Code"
-
-                    # Clean filename
-                    safe_name = vba_filename.replace('/', '_').replace('\\', '_')
-                    if not safe_name:
-                        safe_name = f"module_{len(modules) + 1}"
-
-                    modules.append(VBAModule(
-                        name=safe_name,
-                        module_type=module_type,
-                        code=vba_code,
-                        source_file=file_path,
-                        stream_path=stream_path
-                    ))
+            if not vba_parser.detect_vba_macros():
+                return []
+            return self._build_oletools_modules(file_path, (
+                (stream_path, vba_filename, vba_code)
+                for _, stream_path, vba_filename, vba_code in vba_parser.extract_macros()
+            ))
         finally:
             vba_parser.close()
 
+    def _read_ole_macros(self, source: Union[str, bytes]) -> List[Tuple[str, str, str]]:
+        """
+        Read VBA code from the projects of an OLE compound file.
+
+        Args:
+            source: Path or content of the OLE file
+
+        Returns:
+            (stream_path, vba_filename, vba_code) tuples
+        """
+        macros = []
+        ole = olefile.OleFileIO(source)
+        try:
+            for vba_root, project_path, dir_path in _find_vba_projects(ole):
+                macros.extend(_extract_vba(ole, vba_root, project_path, dir_path, True))
+        finally:
+            ole.close()
+        return macros
+
+    def _read_ooxml_macros(self, file_path: str) -> Tuple[List[Tuple[str, str, str]], bool]:
+        """
+        Read VBA code from the OLE parts of an OOXML file.
+
+        Returns:
+            (stream_path, vba_filename, vba_code) tuples, and whether the
+            archive holds any OLE part at all
+        """
+        macros = []
+        has_ole_parts = False
+
+        with zipfile.ZipFile(file_path) as archive:
+            for info in archive.infolist():
+                if info.is_dir():
+                    continue
+
+                # Only OLE compound files (vbaProject.bin, embedded objects)
+                # can hold VBA projects
+                with archive.open(info) as member:
+                    if member.read(len(olefile.MAGIC)) != olefile.MAGIC:
+                        continue
+                has_ole_parts = True
+
+                macros.extend(self._read_ole_macros(archive.read(info)))
+
+        return macros, has_ole_parts
+
+    def _build_oletools_modules(self, file_path: str,
+                                macros: Iterable[Tuple[str, str, str]]) -> List[VBAModule]:
+        """Build modules from (stream_path, vba_filename, vba_code) tuples."""
+        modules = []
+
+        for stream_path, vba_filename, vba_code in macros:
+            # Determine module type from code
+            if "Attribute VB_PredeclaredId" in vba_code:
+                module_type = "Classe/UserForm"
+            elif vba_code.strip().startswith("Attribute VB_"):
+                module_type = "Module"
+            else:
+                module_type = "Code"
+
+            # Clean filename
+            safe_name = vba_filename.replace('/', '_').replace('\\', '_')
+            if not safe_name:
+                safe_name = f"module_{len(modules) + 1}"
+
+            modules.append(VBAModule(
+                name=safe_name,
+                module_type=module_type,
+                code=vba_code,
+                source_file=file_path,
+                stream_path=stream_path
+            ))
+
         return modules
 
     def _save_modules(self, modules: List[VBAModule], output_dir: str,
@@ -401,19 +648,18 @@ class VBAExtractor:
         """Save extracted modules to files."""
         os.makedirs(output_dir, exist_ok=True)
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        source_name = os.path.basename(source_file)
 
         # Individual files
         if create_individual:
+            # Only the module name and type vary between headers
+            header_tail = f"' Source: {source_name}\n' Extracted: {timestamp}\n' " + "=" * 60 + "\n\n"
+
             for module in modules:
-                filename = f"{module.name}.{module.extension}"
-                filepath = os.path.join(output_dir, filename)
+                filepath = os.path.join(output_dir, f"{module.name}.{module.extension}")
 
                 with open(filepath, 'w', encoding='utf-8') as f:
-                    f.write(f"' Module: {module.name}\n")
-                    f.write(f"' Type: {module.module_type}\n")
-                    f.write(f"' Source: {os.path.basename(source_file)}\n")
-                    f.write(f"' Extracted: {timestamp}\n")
-                    f.write("' " + "=" * 60 + "\n\n")
+                    f.write(f"' Module: {module.name}\n' Type: {module.module_type}\n{header_tail}")
                     f.write(module.code)
 
         # Concatenated file
@@ -421,30 +667,53 @@ class VBAExtractor:
             base_name = Path(source_file).stem
             concat_file = os.path.join(output_dir, f"{base_name}_all_vba.txt")
 
+            # Build the whole file first and write it in one call
+            parts = [
+                "=" * 80 + "\n",
+                f" VBA CODE EXTRACTED FROM: {source_name}\n",
+                f" Extraction Date: {timestamp}\n",
+                f" Total Modules: {len(modules)}\n",
+                "=" * 80 + "\n\n",
+            ]
+
+            # Table of contents
+            parts.append("TABLE OF CONTENTS:\n")
+            parts.append("-" * 40 + "\n")
+            for i, module in enumerate(modules, 1):
+                parts.append(f"{i:3d}. {module.name} ({module.module_type})\n")
+            parts.append("\n" + "=" * 80 + "\n\n")
+
+            # Module contents
+            for i, module in enumerate(modules, 1):
+                parts.append("\n" + "#" * 80 + "\n")
+                parts.append(f"# MODULE {i}: {module.name}\n")
+                parts.append(f"# Type: {module.module_type}\n")
+                parts.append(f"# Lines: {module.line_count}\n")
+                parts.append("#" * 80 + "\n\n")
+                parts.append(module.code)
+                parts.append("\n\n" + "-" * 80 + "\n")
+
+            parts.append("\n" + "=" * 80 + "\n")
+            parts.append(" END OF FILE\n")
+            parts.append("=" * 80 + "\n")
+
             with open(concat_file, 'w', encoding='utf-8') as f:
-                f.write("=" * 80 + "\n")
-                f.write(f" VBA CODE EXTRACTED FROM: {os.path.basename(source_file)}\n")
-                f.write(f" Extraction Date: {timestamp}\n")
-                f.write(f" Total Modules: {len(modules)}\n")
-                f.write("=" * 80 + "\n\n")
-
-                # Table of contents
-                f.write("TABLE OF CONTENTS:\n")
-                f.write("-" * 40 + "\n")
-                for i, module in enumerate(modules, 1):
-                    f.write(f"{i:3d}. {module.name} ({module.module_type})\n")
-                f.write("\n" + "=" * 80 + "\n\n")
-
-                # Module contents
-                for i, module in enumerate(modules, 1):
-                    f.write("\n" + "#" * 80 + "\n")
-                    f.write(f"# MODULE {i}: {module.name}\n")
-                    f.write(f"# Type: {module.module_type}\n")
-                    f.write(f"# Lines: {module.line_count}\n")
-                    f.write("#" * 80 + "\n\n")
-                    f.write(module.code)
-                    f.write("\n\n" + "-" * 80 + "\n")
+                f.write(''.join(parts))
+
+
+_worker_extractors: Dict[ExtractionMethod, VBAExtractor] = {}
+
 
-                f.write("\n" + "=" * 80 + "\n")
-                f.write(" END OF FILE\n")
-                f.write("=" * 80 + "\n")
+def _extract_file_worker(file_path: str, preferred_method: ExtractionMethod,
+                         output_dir: Optional[str], create_individual_files: bool,
+                         create_concatenated_file: bool) -> ExtractionResult:
+    """
+    Process-pool entry point for VBAExtractor.extract_many.
+
+    Module-level so only the arguments are pickled per task; parsers never
+    cross process boundaries.
+    """
+    extractor = _worker_extractors.get(preferred_method)
+    if extractor is None:
+        extractor = _worker_extractors[preferred_method] = VBAExtractor(preferred_method)
+    return extractor.extract(file_path, output_dir, create_individual_files, create_concatenated_file)
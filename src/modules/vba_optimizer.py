@@ -9,6 +9,24 @@ from typing import Dict, List, Tuple, Optional
 from enum import Enum, auto
 
 
+# The part of a line before its comment: anything but quotes and apostrophes,
+# or string literals. VBA escapes a quote inside a literal as "", which
+# reads here as two adjacent literals; an unterminated literal runs to the
+# end of the line.
+_CODE_BEFORE_COMMENT = re.compile(r'(?:[^"\']+|"[^"]*"?)*')
+
+_WORD = re.compile(r'\w+')
+
+# A string literal (kept verbatim, see _CODE_BEFORE_COMMENT) or blanks
+# outside literals that are not already a single space
+_LITERAL_OR_BLANKS = re.compile(r'("[^"]*"?)|[ \t]{2,}|\t')
+
+
+def _collapse_blanks(match: 're.Match[str]') -> str:
+    """Keep a string literal, or collapse blanks to a single space."""
+    return match.group(1) or ' '
+
+
 class OptimizationType(Enum):
     """Types of optimization that can be applied."""
     REMOVE_COMMENTS = auto()
@@ -92,6 +110,15 @@ class VBAOptimizer:
         r'^Case\b',
     ]
 
+    # Each keyword list as one alternation, so a line is tested once per list
+    _INDENT_INCREASE_RE = re.compile('|'.join(f'(?:{p})' for p in INDENT_INCREASE), re.IGNORECASE)
+    _INDENT_DECREASE_RE = re.compile('|'.join(f'(?:{p})' for p in INDENT_DECREASE), re.IGNORECASE)
+    _INDENT_SPECIAL_RE = re.compile('|'.join(f'(?:{p})' for p in INDENT_SPECIAL), re.IGNORECASE)
+
+    _DIM_RE = re.compile(r'^\s*Dim\s+(\w+)', re.IGNORECASE)
+    _PROC_RE = re.compile(r'^\s*(Public|Private|Friend)?\s*(Sub|Function|Property)', re.IGNORECASE | re.MULTILINE)
+    _DIM_ANY_RE = re.compile(r'^\s*Dim\s+', re.IGNORECASE | re.MULTILINE)
+
     def __init__(self):
         self.options = OptimizationOptions()
 
@@ -111,39 +138,42 @@ class VBAOptimizer:
             success=True,
             original_code=code,
             optimized_code=code,
-            original_lines=len(code.splitlines()),
+            original_lines=self._count_lines(code),
             original_size=len(code)
         )
 
         try:
-            optimized = code
+            # Each stage maps a list of lines to a new one; the code is split
+            # and joined only once
+            lines = code.split('\n')
 
             # Apply optimizations in order
             if options.remove_comments:
-                optimized, count = self._remove_comments(optimized)
+                lines, count = self._remove_comments(lines)
                 if count > 0:
                     result.modifications.append(f"Removed {count} comments")
 
             if options.auto_indent:
-                optimized = self._auto_indent(optimized, options.indent_size)
+                lines = self._auto_indent(lines, options.indent_size)
                 result.modifications.append("Applied auto-indentation")
 
             if options.rename_unused_vars:
-                optimized, count = self._rename_unused_variables(optimized)
+                lines, count = self._rename_unused_variables(lines)
                 if count > 0:
                     result.modifications.append(f"Renamed {count} unused variables")
 
             if options.remove_empty_lines:
-                optimized, count = self._remove_empty_lines(optimized)
+                lines, count = self._remove_empty_lines(lines)
                 if count > 0:
                     result.modifications.append(f"Removed {count} empty lines")
 
             if options.minify:
-                optimized = self._minify(optimized)
+                lines = self._minify(lines)
                 result.modifications.append("Minified code")
 
+            optimized = '\n'.join(lines)
             result.optimized_code = optimized
-            result.optimized_lines = len(optimized.splitlines())
+            result.optimized_lines = self._count_lines(optimized)
             result.optimized_size = len(optimized)
 
         except Exception as e:
@@ -152,25 +182,21 @@ class VBAOptimizer:
 
         return result
 
-    def _remove_comments(self, code: str) -> Tuple[str, int]:
+    @staticmethod
+    def _count_lines(code: str) -> int:
+        """Count lines as the stages split them, ignoring a final newline."""
+        return code.count('\n') + (0 if not code or code.endswith('\n') else 1)
+
+    def _remove_comments(self, lines: List[str]) -> Tuple[List[str], int]:
         """Remove VBA comments while preserving strings."""
-        lines = code.split('\n')
         processed_lines = []
         removed_count = 0
 
         for line in lines:
-            # Track if we're inside a string
-            in_string = False
-            comment_pos = -1
-
-            for i, char in enumerate(line):
-                if char == '"' and (i == 0 or line[i-1] != '\\'):
-                    in_string = not in_string
-                elif char == "'" and not in_string:
-                    comment_pos = i
-                    break
-
-            if comment_pos >= 0:
+            # The comment, if any, starts right after the code before it
+            comment_pos = _CODE_BEFORE_COMMENT.match(line).end()
+
+            if comment_pos < len(line):
                 # Remove comment part
                 new_line = line[:comment_pos].rstrip()
                 if new_line or comment_pos == 0:
@@ -179,14 +205,16 @@ class VBAOptimizer:
             else:
                 processed_lines.append(line)
 
-        return '\n'.join(processed_lines), removed_count
+        return processed_lines, removed_count
 
-    def _auto_indent(self, code: str, indent_size: int = 4) -> str:
+    def _auto_indent(self, lines: List[str], indent_size: int = 4) -> List[str]:
         """Apply automatic indentation to VBA code."""
-        lines = code.split('\n')
         processed_lines = []
         indent_level = 0
         indent_str = ' ' * indent_size
+        increase = self._INDENT_INCREASE_RE.match
+        decrease = self._INDENT_DECREASE_RE.match
+        special = self._INDENT_SPECIAL_RE.match
 
         for line in lines:
             stripped = line.strip()
@@ -196,77 +224,69 @@ class VBAOptimizer:
                 continue
 
             # Check for indent decrease (before adding line)
-            for pattern in self.INDENT_DECREASE:
-                if re.match(pattern, stripped, re.IGNORECASE):
-                    indent_level = max(0, indent_level - 1)
-                    break
-
-            # Check for special keywords (temporary decrease)
-            temp_decrease = False
-            for pattern in self.INDENT_SPECIAL:
-                if re.match(pattern, stripped, re.IGNORECASE):
-                    temp_decrease = True
-                    break
-
-            # Add line with appropriate indentation
-            if temp_decrease:
+            if decrease(stripped):
+                indent_level = max(0, indent_level - 1)
+
+            # Add line with appropriate indentation; special keywords are
+            # temporarily decreased
+            if special(stripped):
                 processed_lines.append(indent_str * max(0, indent_level - 1) + stripped)
             else:
                 processed_lines.append(indent_str * indent_level + stripped)
 
             # Check for indent increase (after adding line)
-            for pattern in self.INDENT_INCREASE:
-                if re.match(pattern, stripped, re.IGNORECASE):
-                    indent_level += 1
-                    break
+            if increase(stripped):
+                indent_level += 1
 
-        return '\n'.join(processed_lines)
+        return processed_lines
 
-    def _rename_unused_variables(self, code: str) -> Tuple[str, int]:
+    def _rename_unused_variables(self, lines: List[str]) -> Tuple[List[str], int]:
         """Rename unused variables with 'unused_' prefix."""
-        lines = code.split('\n')
 
-        # Find all variable declarations
-        var_pattern = re.compile(r'^\s*Dim\s+(\w+)', re.IGNORECASE)
-        declared_vars = set()
+        # Find all variable declarations, keeping the other lines
+        declared_vars = {}
+        other_lines = []
+        dim_match = self._DIM_RE.match
 
         for line in lines:
-            match = var_pattern.match(line)
+            match = dim_match(line)
             if match:
-                declared_vars.add(match.group(1))
-
-        # Count usage of each variable
-        var_usage = {var: 0 for var in declared_vars}
+                declared_vars[match.group(1)] = None
+            else:
+                other_lines.append(line)
 
-        for line in lines:
-            if not var_pattern.match(line):
-                for var in declared_vars:
-                    var_usage[var] += len(re.findall(r'\b' + re.escape(var) + r'\b', line))
+        # Collect every word used outside declarations in one pass. A name is
+        # all word characters, so \bname\b only ever matches a whole word.
+        used_words = set(_WORD.findall('\n'.join(other_lines)))
 
         # Find unused variables
-        unused_vars = [var for var, count in var_usage.items() if count == 0]
+        unused_vars = [var for var in declared_vars if var not in used_words]
+        if not unused_vars:
+            return lines, 0
+
+        # Rename unused variables over the whole code in one substitution.
+        # Declarations match case-insensitively, so names differing only in
+        # case take the first declared spelling.
+        new_names = {}
+        for var in unused_vars:
+            new_names.setdefault(var.lower(), var)
+        pattern = re.compile(
+            r'\bDim\s+(' + '|'.join(map(re.escape, new_names.values())) + r')\b',
+            re.IGNORECASE
+        )
+        renamed = set()
 
-        # Rename unused variables
-        processed_code = code
-        renamed_count = 0
+        def rename(match: 're.Match[str]') -> str:
+            var = new_names.get(match.group(1).lower(), match.group(1))
+            renamed.add(var)
+            return f'Dim unused_{var}'
 
-        for var in unused_vars:
-            new_name = f"unused_{var}"
-            pattern = r'\bDim\s+' + re.escape(var) + r'\b'
-            if re.search(pattern, processed_code, re.IGNORECASE):
-                processed_code = re.sub(
-                    pattern,
-                    f'Dim {new_name}',
-                    processed_code,
-                    flags=re.IGNORECASE
-                )
-                renamed_count += 1
-
-        return processed_code, renamed_count
-
-    def _remove_empty_lines(self, code: str) -> Tuple[str, int]:
+        processed_code = pattern.sub(rename, '\n'.join(lines))
+
+        return processed_code.split('\n'), len(renamed)
+
+    def _remove_empty_lines(self, lines: List[str]) -> Tuple[List[str], int]:
         """Remove excessive empty lines (keep max one consecutive)."""
-        lines = code.split('\n')
         processed_lines = []
         prev_empty = False
         removed_count = 0
@@ -284,11 +304,10 @@ class VBAOptimizer:
                 processed_lines.append(line)
                 prev_empty = False
 
-        return '\n'.join(processed_lines), removed_count
+        return processed_lines, removed_count
 
-    def _minify(self, code: str) -> str:
+    def _minify(self, lines: List[str]) -> List[str]:
         """Minify VBA code by removing unnecessary whitespace."""
-        lines = code.split('\n')
         processed_lines = []
 
         for line in lines:
@@ -300,28 +319,13 @@ class VBAOptimizer:
             minified = self._minify_line(stripped)
             processed_lines.append(minified)
 
-        return '\n'.join(processed_lines)
+        return processed_lines
 
     def _minify_line(self, line: str) -> str:
         """Minify a single line while preserving strings."""
-        result = []
-        in_string = False
-        prev_char = ''
-
-        for char in line:
-            if char == '"' and prev_char != '\\':
-                in_string = not in_string
-                result.append(char)
-            elif in_string:
-                result.append(char)
-            elif char == ' ':
-                if result and result[-1] != ' ':
-                    result.append(char)
-            else:
-                result.append(char)
-            prev_char = char
-
-        return ''.join(result)
+        if '  ' not in line and '\t' not in line:
+            return line
+        return _LITERAL_OR_BLANKS.sub(_collapse_blanks, line)
 
     def get_example(self, optimization_type: OptimizationType) -> Tuple[str, str]:
         """Get before/after example for an optimization type."""
@@ -359,15 +363,10 @@ class VBAOptimizer:
         comment_lines = sum(1 for line in lines if line.strip().startswith("'"))
 
         # Count procedures
-        proc_pattern = re.compile(
-            r'^\s*(Public|Private|Friend)?\s*(Sub|Function|Property)',
-            re.IGNORECASE | re.MULTILINE
-        )
-        procedures = len(proc_pattern.findall(code))
+        procedures = len(self._PROC_RE.findall(code))
 
         # Count variables
-        var_pattern = re.compile(r'^\s*Dim\s+', re.IGNORECASE | re.MULTILINE)
-        variables = len(var_pattern.findall(code))
+        variables = len(self._DIM_ANY_RE.findall(code))
 
         return {
             "total_lines": total_lines,
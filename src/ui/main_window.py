@@ -83,11 +83,15 @@ class HelpSystem:
 
 class BaseToolFrame(ctk.CTkFrame):
     """Base class for tool frames."""
+    # Progress updates are coalesced into one redraw per interval (20 Hz)
+    PROGRESS_INTERVAL_MS = 50
+
     def __init__(self, parent, tool_id, tool_name, **kw):
         super().__init__(parent, **kw)
         self.tool_id, self.tool_name = tool_id, tool_name
         self.config, self.export_manager, self.logger = get_config(), get_export_manager(), get_logger()
         self.is_running, self._last_result = False, None
+        self._pending_progress, self._progress_scheduled = None, False
         self._create_header()
         self._create_content()
         self._create_footer()
@@ -133,6 +137,17 @@ class BaseToolFrame(ctk.CTkFrame):
                 messagebox.showerror("Error", f"Export failed: {r.message}")
 
     def set_progress(self, val, status=None):
+        # Keep the latest value and status; a status from an earlier call in
+        # the same interval still shows if this one has none
+        if status is None and self._pending_progress: status = self._pending_progress[1]
+        self._pending_progress = (val, status)
+        if not self._progress_scheduled:
+            self._progress_scheduled = True
+            self.after(self.PROGRESS_INTERVAL_MS, self._flush_progress)
+
+    def _flush_progress(self):
+        val, status = self._pending_progress
+        self._pending_progress, self._progress_scheduled = None, False
         self.progress_bar.set(val)
         if status: self.status_label.configure(text=status)
 
@@ -145,7 +160,9 @@ class BaseToolFrame(ctk.CTkFrame):
                 res = func()
                 self.after(0, lambda: self._done(res, callback))
             except Exception as e:
-                self.after(0, lambda: self._err(str(e)))
+                # e is cleared when the except block ends, before Tk runs the callback
+                msg = str(e)
+                self.after(0, lambda: self._err(msg))
         threading.Thread(target=run, daemon=True).start()
 
     def _done(self, res, cb):
@@ -181,14 +198,20 @@ class VBAExtractorFrame(BaseToolFrame):
         ctk.CTkEntry(ef, textvariable=self.file_var, placeholder_text="Select Office file...", height=28).pack(side="left", fill="x", expand=True, padx=(0, 4))
         ctk.CTkButton(ef, text="...", width=35, height=28, command=self._browse).pack(side="right")
 
-        # Frame scrollable pour les options
-        opts_scroll = ctk.CTkScrollableFrame(left, label_text="⚙️ Options", label_font=ctk.CTkFont(size=11, weight="bold"),
-                                              fg_color=("gray88", "gray20"), corner_radius=8)
-        opts_scroll.pack(fill="both", expand=True, padx=8, pady=8)
+        # Bouton Extract, packé avant les options pour rester visible
+        ctk.CTkButton(left, text="▶ Extract VBA", command=self._extract, height=36,
+                      font=ctk.CTkFont(size=12, weight="bold"),
+                      fg_color=("#10b981", "#059669"), hover_color=("#059669", "#047857")).pack(side="bottom", padx=8, pady=8, fill="x")
+
+        # Options : peu nombreuses et fixes, un frame simple évite les
+        # redessins du canvas d'un CTkScrollableFrame
+        opts_frame = ctk.CTkFrame(left, fg_color=("gray88", "gray20"), corner_radius=8)
+        opts_frame.pack(fill="both", expand=True, padx=8, pady=(8, 0))
+        ctk.CTkLabel(opts_frame, text="⚙️ Options", font=ctk.CTkFont(size=11, weight="bold")).pack(pady=(4, 0))
 
         # === Section: Output Format ===
-        out_frame = ctk.CTkFrame(opts_scroll, fg_color=("gray95", "gray25"), corner_radius=6)
-        out_frame.pack(fill="x", pady=4)
+        out_frame = ctk.CTkFrame(opts_frame, fg_color=("gray95", "gray25"), corner_radius=6)
+        out_frame.pack(fill="x", padx=6, pady=4)
         ctk.CTkLabel(out_frame, text="Format de sortie", font=ctk.CTkFont(size=10, weight="bold"),
                      text_color=("#059669", "#10b981")).pack(anchor="w", padx=8, pady=(6, 2))
 
@@ -201,8 +224,8 @@ class VBAExtractorFrame(BaseToolFrame):
                         font=ctk.CTkFont(size=10), height=22, checkbox_width=18, checkbox_height=18).pack(anchor="w", padx=12, pady=(1, 6))
 
         # === Section: Extraction Method ===
-        meth_frame = ctk.CTkFrame(opts_scroll, fg_color=("gray95", "gray25"), corner_radius=6)
-        meth_frame.pack(fill="x", pady=4)
+        meth_frame = ctk.CTkFrame(opts_frame, fg_color=("gray95", "gray25"), corner_radius=6)
+        meth_frame.pack(fill="x", padx=6, pady=4)
         ctk.CTkLabel(meth_frame, text="Méthode d'extraction", font=ctk.CTkFont(size=10, weight="bold"),
                      text_color=("#059669", "#10b981")).pack(anchor="w", padx=8, pady=(6, 2))
 
@@ -212,8 +235,8 @@ class VBAExtractorFrame(BaseToolFrame):
                           font=ctk.CTkFont(size=10)).pack(anchor="w", padx=12, pady=(2, 6))
 
         # === Section: Advanced Options (NEW) ===
-        adv_frame = ctk.CTkFrame(opts_scroll, fg_color=("gray95", "gray25"), corner_radius=6)
-        adv_frame.pack(fill="x", pady=4)
+        adv_frame = ctk.CTkFrame(opts_frame, fg_color=("gray95", "gray25"), corner_radius=6)
+        adv_frame.pack(fill="x", padx=6, pady=4)
         ctk.CTkLabel(adv_frame, text="🔧 Options avancées", font=ctk.CTkFont(size=10, weight="bold"),
                      text_color=("#f59e0b", "#fbbf24")).pack(anchor="w", padx=8, pady=(6, 2))
 
@@ -234,8 +257,8 @@ class VBAExtractorFrame(BaseToolFrame):
                         font=ctk.CTkFont(size=10), height=22, checkbox_width=18, checkbox_height=18).pack(anchor="w", padx=12, pady=(1, 6))
 
         # === Section: Encoding (NEW) ===
-        enc_frame = ctk.CTkFrame(opts_scroll, fg_color=("gray95", "gray25"), corner_radius=6)
-        enc_frame.pack(fill="x", pady=4)
+        enc_frame = ctk.CTkFrame(opts_frame, fg_color=("gray95", "gray25"), corner_radius=6)
+        enc_frame.pack(fill="x", padx=6, pady=4)
         ctk.CTkLabel(enc_frame, text="Encodage", font=ctk.CTkFont(size=10, weight="bold"),
                      text_color=("#059669", "#10b981")).pack(anchor="w", padx=8, pady=(6, 2))
 
@@ -244,11 +267,6 @@ class VBAExtractorFrame(BaseToolFrame):
                           variable=self.encoding_var, width=120, height=26,
                           font=ctk.CTkFont(size=10)).pack(anchor="w", padx=12, pady=(2, 6))
 
-        # Bouton Extract
-        ctk.CTkButton(left, text="▶ Extract VBA", command=self._extract, height=36,
-                      font=ctk.CTkFont(size=12, weight="bold"),
-                      fg_color=("#10b981", "#059669"), hover_color=("#059669", "#047857")).pack(padx=8, pady=8, fill="x")
-
         # Panneau droit - Résultats
         right = ctk.CTkFrame(self.content_frame)
         right.pack(side="right", fill="both", expand=True, padx=(4, 0))
@@ -275,9 +293,9 @@ class VBAExtractorFrame(BaseToolFrame):
             self._last_result = {"success": r.success, "modules": r.total_modules, "lines": r.total_lines}
             self.results_text.delete("1.0", "end")
             if r.success:
-                self.results_text.insert("end", f"Extracted {r.total_modules} modules ({r.total_lines} lines)\n\n")
-                for m in r.modules:
-                    self.results_text.insert("end", f"* {m.name}.{m.extension} - {m.line_count} lines\n")
+                # One insert for the whole listing: each insert relayouts the textbox
+                lines = "".join(f"* {m.name}.{m.extension} - {m.line_count} lines\n" for m in r.modules)
+                self.results_text.insert("end", f"Extracted {r.total_modules} modules ({r.total_lines} lines)\n\n{lines}")
                 self.set_progress(1.0, f"{r.total_modules} modules extracted")
             else:
                 self.results_text.insert("end", f"Error: {r.error_message}")
@@ -316,15 +334,14 @@ class PythonAnalyzerFrame(BaseToolFrame):
                       font=ctk.CTkFont(size=10, weight="bold"),
                       fg_color=("#3b82f6", "#2563eb"), hover_color=("#2563eb", "#1d4ed8")).pack(side="left", padx=2)
 
-        # Options scrollable frame
-        opts_scroll = ctk.CTkScrollableFrame(top, height=120, label_text="⚙️ Options",
-                                              label_font=ctk.CTkFont(size=10, weight="bold"),
-                                              fg_color=("gray88", "gray20"), corner_radius=6)
-        opts_scroll.pack(fill="x", padx=4, pady=4)
+        # Options frame (fixed set of columns, no scrolling needed)
+        opts_frame = ctk.CTkFrame(top, fg_color=("gray88", "gray20"), corner_radius=6)
+        opts_frame.pack(fill="x", padx=4, pady=4)
+        ctk.CTkLabel(opts_frame, text="⚙️ Options", font=ctk.CTkFont(size=10, weight="bold")).pack(pady=(2, 0))
 
         # Options grid
-        opts_grid = ctk.CTkFrame(opts_scroll, fg_color="transparent")
-        opts_grid.pack(fill="x")
+        opts_grid = ctk.CTkFrame(opts_frame, fg_color="transparent")
+        opts_grid.pack(fill="x", padx=4, pady=(0, 4))
 
         cfg = self.config.config.python_analyzer
 
@@ -469,8 +486,7 @@ class PythonAnalyzerFrame(BaseToolFrame):
             self.stats_text.delete("1.0", "end")
             self.stats_text.insert("1.0", f"Files: {s['total_files']}\nLines: {s['total_lines']:,}\nCode: {s['total_code_lines']:,}\nClasses: {s['total_classes']}\nFunctions: {s['total_functions']}\nDoc ratio: {s['documentation_ratio']:.1f}%")
             self.files_text.delete("1.0", "end")
-            for x in a[:50]:
-                self.files_text.insert("end", f"{x.name} - {x.line_count} lines\n")
+            self.files_text.insert("end", "".join(f"{x.name} - {x.line_count} lines\n" for x in a[:50]))
             self.set_progress(1.0, f"Analyzed {len(a)} files")
         self.run_async(do, done)
 
@@ -500,28 +516,35 @@ class PythonAnalyzerFrame(BaseToolFrame):
             max_size = 500
 
         def do():
-            return self.analyzer.extract_code_hierarchy(
-                d,
-                include_subdirs=self.subdirs_var.get(),
-                exclude_patterns=exclude_patterns,
-                exclude_dirs=exclude_dirs,
-                include_content=self.include_content_var.get(),
-                max_file_size_kb=max_size
-            )
-
-        def done(content):
+            # Stream the extraction into the file from the worker thread, so
+            # neither the report nor the write sits on the Tk thread
             try:
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
-                self._last_result = {"output_path": output_path, "size": len(content)}
-                self.set_progress(1.0, f"Extracted to {Path(output_path).name}")
-                messagebox.showinfo("Success", f"Code extracted to:\n{output_path}")
-                # Open file if option enabled
-                if self.config.config.export.open_after_export:
-                    webbrowser.open(output_path)
+                with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                    self.analyzer.extract_code_hierarchy(
+                        d,
+                        include_subdirs=self.subdirs_var.get(),
+                        exclude_patterns=exclude_patterns,
+                        exclude_dirs=exclude_dirs,
+                        include_content=self.include_content_var.get(),
+                        max_file_size_kb=max_size,
+                        sink=f
+                    )
+                return Path(output_path).stat().st_size
             except Exception as e:
-                self.set_progress(0, "Failed")
-                messagebox.showerror("Error", f"Failed to save: {e}")
+                # Do not leave a partly written extraction behind
+                try:
+                    os.remove(output_path)
+                except OSError:
+                    pass
+                raise Exception(f"Failed to save: {e}") from e
+
+        def done(size):
+            self._last_result = {"output_path": output_path, "size": size}
+            self.set_progress(1.0, f"Extracted to {Path(output_path).name}")
+            messagebox.showinfo("Success", f"Code extracted to:\n{output_path}")
+            # Open file if option enabled
+            if self.config.config.export.open_after_export:
+                webbrowser.open(output_path)
 
         self.run_async(do, done)
 
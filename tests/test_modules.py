@@ -12,10 +12,17 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
 from modules.python_analyzer import PythonAnalyzer
-from modules.folder_scanner import FolderScanner
+from modules.folder_scanner import FolderScanner, DirectoryEntry, ScanResult
 from modules.vba_optimizer import VBAOptimizer, OptimizationOptions
+from modules.vba_analyzer import MATPLOTLIB_AVAILABLE, PANDAS_AVAILABLE, VBAAnalyzer, get_hex_preview
+from modules.vba_extractor import (
+    OLE_DIRECT_AVAILABLE, ExtractionMethod, ExtractionResult, VBAExtractor,
+)
+from modules.report_generator import ReportGenerator, _ReportEncoder, _format_size
 from core.workflow import WorkflowManager, WorkflowStep, StepResult
 
+FIXTURES = Path(__file__).parent / 'fixtures'
+
 
 class TestPythonAnalyzer(unittest.TestCase):
     """Tests for PythonAnalyzer module."""
@@ -75,6 +82,132 @@ from typing import List, Dict
             os.unlink(temp_path)
 
 
+    def test_methods_and_complexity(self):
+        """Test method detection, async methods and nested complexity."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
+            f.write('''
+class Service:
+    """Service docstring."""
+    async def fetch(self):
+        return 1
+
+def outer(x):
+    if x and x > 1:
+        def inner():
+            for _ in range(3):
+                pass
+        return inner
+''')
+            temp_path = f.name
+
+        try:
+            analysis = self.analyzer.analyze_file(temp_path)
+
+            self.assertEqual([m.name for m in analysis.classes[0].methods], ['fetch'])
+            self.assertEqual([fn.name for fn in analysis.functions], ['outer', 'inner'])
+            complexities = {fn.name: fn.complexity for fn in analysis.functions}
+            self.assertEqual(complexities, {'outer': 4, 'inner': 2})
+            self.assertEqual(analysis.docstring_lines, 1)
+
+        finally:
+            os.unlink(temp_path)
+
+    def test_signature_formatting(self):
+        """Test that bases, decorators and annotations are rendered as in the source."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
+            f.write('''
+import abc, typing
+
+@typing.final
+class Model(abc.ABC, metaclass=abc.ABCMeta):
+    @staticmethod
+    def build(name: str, size: "int" = 0, *, tags: list[str] | None = None) -> typing.Optional[dict]:
+        pass
+''')
+            temp_path = f.name
+
+        try:
+            analysis = self.analyzer.analyze_file(temp_path)
+            cls = analysis.classes[0]
+            method = cls.methods[0]
+
+            self.assertEqual(cls.bases, ['abc.ABC'])
+            self.assertEqual(cls.decorators, ['typing.final'])
+            self.assertEqual(method.decorators, ['staticmethod'])
+            self.assertEqual(method.args, ['name: str', "size: 'int'"])
+            self.assertEqual(method.return_type, 'typing.Optional[dict]')
+
+        finally:
+            os.unlink(temp_path)
+
+    def test_analyze_directory_process_pool(self):
+        """Test that directory analysis gives the same results with worker processes."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for i in range(5):
+                Path(tmpdir, f'mod_{i}.py').write_text(f'import os\n\ndef func_{i}():\n    return {i}\n')
+
+            threaded = self.analyzer.analyze_directory(tmpdir)
+            self.analyzer.PROCESS_POOL_MIN_FILES = 1
+            pooled = self.analyzer.analyze_directory(tmpdir)
+
+            self.assertEqual([a.path for a in pooled], [a.path for a in threaded])
+            self.assertEqual([a.functions[0].name for a in pooled], [f'func_{i}' for i in range(5)])
+            self.assertTrue(all('os' in a.dependencies for a in pooled))
+
+    def test_external_dependencies(self):
+        """Test that stdlib imports are filtered and appended analyses are picked up."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            Path(tmpdir, 'a.py').write_text('import os\nimport requests\n')
+            Path(tmpdir, 'b.py').write_text('from yaml import safe_load\n')
+
+            analyses = self.analyzer.analyze_directory(tmpdir)
+            self.assertEqual(self.analyzer.get_external_dependencies(analyses), {'requests', 'yaml'})
+            self.assertEqual(self.analyzer.get_live_external_dependencies(), {'requests', 'yaml'})
+
+            analyses.append(self.analyzer.analyze_file(str(Path(tmpdir, 'a.py'))))
+            analyses[-1].dependencies.add('numpy')
+            self.assertIn('numpy', self.analyzer.get_external_dependencies(analyses))
+
+            analyses[0].dependencies.add('pandas')
+            self.assertIn('pandas', self.analyzer.get_external_dependencies(analyses))
+
+    def test_analyze_directory_async(self):
+        """Test that the async directory analysis matches the synchronous one."""
+        import asyncio
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for i in range(3):
+                Path(tmpdir, f'mod_{i}.py').write_text(f'# module {i}\nimport json\n\nVALUE = {i}\n')
+
+            expected = self.analyzer.analyze_directory(tmpdir)
+            actual = asyncio.run(self.analyzer.analyze_directory_async(tmpdir))
+
+            self.assertEqual([(a.path, a.line_count, a.comment_lines) for a in actual],
+                             [(a.path, a.line_count, a.comment_lines) for a in expected])
+            self.assertEqual(actual[0].global_variables, ['VALUE'])
+
+    def test_save_code_extraction_streams_same_output(self):
+        """Test that saving to disk writes the same text extract_code_hierarchy returns."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            src = Path(tmpdir, 'src')
+            src.mkdir()
+            (src / 'app.py').write_text('def main():\n    return 0\n')
+            (src / 'test_app.py').write_text('def test_main():\n    pass\n')
+            output_path = Path(tmpdir, 'extraction.txt')
+
+            expected = self.analyzer.extract_code_hierarchy(str(src), exclude_patterns=['test_*.py'])
+            self.assertTrue(self.analyzer.save_code_extraction(
+                str(src), str(output_path), exclude_patterns=['test_*.py']))
+            saved = output_path.read_text(encoding='utf-8')
+
+            def strip_date(text):
+                return [line for line in text.splitlines() if 'Generated:' not in line]
+
+            self.assertEqual(strip_date(saved), strip_date(expected))
+            self.assertIn('1 | def main():', saved)
+            self.assertNotIn('test_app.py', saved)
+
+
 class TestFolderScanner(unittest.TestCase):
     """Tests for FolderScanner module."""
 
@@ -115,6 +248,51 @@ class TestFolderScanner(unittest.TestCase):
             self.assertIn('subdir', tree)
             self.assertIn('nested.txt', tree)
 
+    def test_glob_excluded_dirs(self):
+        """Test that wildcard directory exclusions such as *.egg-info are honoured."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            Path(tmpdir, 'pkg.egg-info').mkdir()
+            Path(tmpdir, 'pkg.egg-info', 'PKG-INFO').write_text('meta')
+            Path(tmpdir, 'main.py').write_text('print("main")')
+
+            result = self.scanner.scan(tmpdir)
+
+            self.assertEqual(result.total_files, 1)
+            self.assertEqual(result.total_directories, 0)
+
+    def test_symlinked_directories_left_out(self):
+        """Test that symlinked directories are neither followed nor shown as empty folders."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            Path(tmpdir, 'real').mkdir()
+            Path(tmpdir, 'real', 'data.txt').write_text('data')
+            try:
+                os.symlink(Path(tmpdir, 'real'), Path(tmpdir, 'link'), target_is_directory=True)
+            except (OSError, NotImplementedError):
+                self.skipTest("symbolic links are not available")
+
+            result = self.scanner.scan(tmpdir)
+
+            self.assertEqual([d.name for d in result.root_entry.subdirectories], ['real'])
+            self.assertEqual(result.total_directories, 1)
+            self.assertEqual(result.total_files, 1)
+            self.assertNotIn('link', self.scanner.generate_tree(result))
+
+    def test_generate_tree_deep_nesting(self):
+        """Test tree generation on trees deeper than the recursion limit."""
+        depth = sys.getrecursionlimit() + 100
+        root = DirectoryEntry(path="d0", name="d0")
+        current = root
+        for i in range(1, depth):
+            child = DirectoryEntry(path=f"d{i}", name=f"d{i}")
+            current.subdirectories.append(child)
+            current = child
+
+        result = ScanResult(root_path="d0", root_entry=root)
+        tree = self.scanner.generate_tree(result)
+
+        self.assertEqual(len(tree.split('\n')), depth)
+        self.assertEqual(self.scanner._count_directories(root), depth - 1)
+
 
 class TestVBAOptimizer(unittest.TestCase):
     """Tests for VBAOptimizer module."""
@@ -135,6 +313,43 @@ x = 5"""
         self.assertNotIn("This is a comment", result.optimized_code)
         self.assertIn("Dim x As Integer", result.optimized_code)
 
+    def test_remove_comments_keeps_strings(self):
+        """Test that apostrophes inside string literals are not comments."""
+        code = 'MsgBox "It\'s ""quoted""" \' note\nPath = "C:\\dir\\" \' trailing\nx = "open \' string'
+
+        optimized, count = self.optimizer._remove_comments(code.split('\n'))
+
+        self.assertEqual(count, 2)
+        self.assertEqual('\n'.join(optimized), 'MsgBox "It\'s ""quoted"""\nPath = "C:\\dir\\"\nx = "open \' string')
+
+    def test_rename_unused_variables(self):
+        """Test that only variables never used outside Dim lines are renamed."""
+        code = "Dim total As Long\nDim temp As Long\nDim count As Long\ntotal = count + 1\ntemperature = 2"
+
+        optimized, count = self.optimizer._rename_unused_variables(code.split('\n'))
+
+        self.assertEqual(count, 1)
+        self.assertIn("Dim unused_temp As Long", optimized)
+        self.assertIn("Dim total As Long", optimized)
+        self.assertIn("Dim count As Long", optimized)
+
+    def test_line_counts(self):
+        """Test that line counts ignore a trailing newline."""
+        result = self.optimizer.optimize("x = 1\r\n\r\ny = 2\r\n", OptimizationOptions(remove_empty_lines=True))
+
+        self.assertEqual(result.original_lines, 3)
+        self.assertEqual(result.optimized_lines, 3)
+        self.assertEqual(self.optimizer.optimize("").original_lines, 0)
+
+    def test_minify_line_keeps_strings(self):
+        """Test that minify collapses blanks outside string literals only."""
+        line = 'path = "C:\\dir\\"  &   "a  ""b""  c"\t&  x'
+
+        self.assertEqual(
+            self.optimizer._minify_line(line),
+            'path = "C:\\dir\\" & "a  ""b""  c" & x'
+        )
+
     def test_auto_indent(self):
         """Test auto-indentation."""
         code = """Sub Test()
@@ -170,6 +385,404 @@ Line 3"""
         self.assertNotIn('\n\n\n', result.optimized_code)
 
 
+class TestVBAAnalyzer(unittest.TestCase):
+    """Tests for VBAAnalyzer module."""
+
+    def setUp(self):
+        self.analyzer = VBAAnalyzer()
+
+    def test_analyze_code(self):
+        """Test procedure, variable and constant extraction."""
+        code = """Option Explicit
+Public Const MAX_ROWS As Long = 100
+Private counter As Integer
+
+Public Function Total(a As Long, b As Long) As Long
+    Dim x, y As Long
+    Const RATE = 2
+    Total = a + b
+End Function
+
+Sub Reset()
+End Sub
+Dim tail As String"""
+
+        result = self.analyzer.analyze_code(code, "Module1")
+
+        self.assertTrue(result.success)
+        procedures = [(p.name, p.procedure_type, p.scope, p.return_type, p.line_number)
+                      for p in result.procedures]
+        self.assertEqual(procedures, [
+            ("Total", "Function", "Public", "Long", 5),
+            ("Reset", "Sub", "Public", None, 11),
+        ])
+        self.assertEqual(result.procedures[0].parameters, "a As Long, b As Long")
+
+        variables = [(v.name, v.declaration, v.scope, v.procedure_name, v.line_number)
+                     for v in result.variables]
+        self.assertEqual(variables, [
+            ("MAX_ROWS", "Const", "Public", None, 2),
+            ("counter", "Private", "Private", None, 3),
+            ("x", "Dim", "Local", "Total", 6),
+            ("y", "Dim", "Local", "Total", 6),
+            ("RATE", "Const", "Private", "Total", 7),
+            ("tail", "Dim", "Module", None, 13),
+        ])
+        self.assertEqual(result.variables[0].value, "100")
+
+        # The RE2 engine, when installed, must agree with re
+        re2_result = VBAAnalyzer(use_re2=True).analyze_code(code, "Module1")
+        self.assertEqual(re2_result.to_dict(), result.to_dict())
+
+    def test_analyze_many(self):
+        """Test batch analysis, sequential and in worker processes."""
+        modules = [(f"Sub P{i}()\nDim v{i} As Long\nEnd Sub", f"Module{i}", "book.xlsm")
+                   for i in range(3)]
+        expected = [self.analyzer.analyze_code(*module).to_dict() for module in modules]
+
+        self.assertEqual([r.to_dict() for r in self.analyzer.analyze_many(modules)], expected)
+
+        self.analyzer.PROCESS_POOL_MIN_CHARS = 0
+        results = self.analyzer.analyze_many(modules, max_workers=2)
+        self.assertEqual([r.to_dict() for r in results], expected)
+
+    def test_generate_report_with_stats(self):
+        """Test that precomputed statistics give the same report."""
+        results = [self.analyzer.analyze_code("Sub A()\nDim x As Long\nEnd Sub", "Module1")]
+        stats = self.analyzer.generate_statistics(results)
+
+        self.assertEqual(stats['procedures_by_type'], {'Sub': 1})
+        self.assertEqual(stats['variables_by_declaration'], {'Dim': 1})
+        # Skip the header, whose date line may differ
+        self.assertEqual(self.analyzer.generate_report(results, stats).split('\n')[3:],
+                         self.analyzer.generate_report(results).split('\n')[3:])
+
+    def _declaration_results(self):
+        """Two modules with a constant, a local variable and two procedures."""
+        return [
+            self.analyzer.analyze_code("Public Const N As Long = 5\nSub A()\nDim x As Long\nEnd Sub",
+                                       "Module1", "book.xlsm"),
+            self.analyzer.analyze_code("Private Function F() As String\nEnd Function",
+                                       "Module2", "book.xlsm"),
+        ]
+
+    @unittest.skipUnless(PANDAS_AVAILABLE, "pandas is not installed")
+    def test_to_dataframe(self):
+        """Test DataFrame rows and the category dtype of the low-cardinality columns."""
+        df = self.analyzer.to_dataframe(self._declaration_results())
+
+        self.assertEqual(tuple(df.columns), VBAAnalyzer.DATAFRAME_COLUMNS)
+        categorical = [name for name in df.columns if df[name].dtype == 'category']
+        self.assertEqual(categorical, list(VBAAnalyzer.CATEGORICAL_COLUMNS))
+        self.assertEqual(df['Ligne'].dtype, 'int64')
+        self.assertEqual(
+            df[['Module', 'Procedure', 'Declaration', 'Nom_Variable', 'Type_Variable', 'Ligne']]
+            .astype(object).values.tolist(),
+            [
+                ['Module1', 'A', 'Procedure', '', '', 2],
+                ['Module1', '', 'Const', 'N', 'Long', 1],
+                ['Module1', 'A', 'Dim', 'x', 'Long', 3],
+                ['Module2', 'F', 'Procedure', '', 'String', 1],
+            ]
+        )
+        self.assertEqual(list(df['Declaration'].cat.categories), ['Const', 'Dim', 'Procedure'])
+
+    @unittest.skipUnless(PANDAS_AVAILABLE and MATPLOTLIB_AVAILABLE, "pandas or matplotlib is not installed")
+    def test_plot_declarations_distribution(self):
+        """Test the Module x Declaration counts plotted from the categorical columns."""
+        import matplotlib.pyplot as plt
+
+        fig = self.analyzer.plot_declarations_distribution(self._declaration_results())
+        try:
+            ax = fig.axes[0]
+            self.assertEqual(ax.get_legend_handles_labels()[1], ['Const', 'Dim', 'Procedure'])
+            # Stacked areas: each line holds the running total per module
+            totals = [list(line.get_ydata()) for line in ax.get_lines()]
+            self.assertEqual(totals, [[1, 0], [2, 0], [3, 1]])
+        finally:
+            plt.close(fig)
+
+    def test_hex_preview(self):
+        """Test hex dump formatting."""
+        with tempfile.NamedTemporaryFile(mode='wb', suffix='.bin', delete=False) as f:
+            f.write(b'Attribute VB_Name\x00\x01\xff')
+            temp_path = f.name
+
+        try:
+            preview = get_hex_preview(temp_path)
+            lines = preview.split('\n')
+
+            self.assertEqual(lines[-2], "00000000  41 74 74 72 69 62 75 74  65 20 56 42 5F 4E 61 6D  Attribute VB_Nam")
+            self.assertEqual(lines[-1], "00000010  65 00 01 FF                                       e...")
+        finally:
+            os.unlink(temp_path)
+
+
+class TestVBAExtractor(unittest.TestCase):
+    """Tests for VBAExtractor module."""
+
+    def setUp(self):
+        self.extractor = VBAExtractor()
+
+    def test_extract_many_keeps_order(self):
+        """Test that batch extraction returns one result per file, in order."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            text_file = os.path.join(temp_dir, "notes.txt")
+            Path(text_file).write_text("not a workbook")
+            paths = [os.path.join(temp_dir, "missing.xlsm"), text_file]
+
+            results = self.extractor.extract_many(paths, max_workers=2)
+
+        self.assertEqual([r.source_file for r in results], paths)
+        self.assertFalse(any(r.success for r in results))
+        self.assertIn("File not found", results[0].error_message)
+        self.assertIn("Unsupported file type", results[1].error_message)
+
+    def test_extract_many_runs_office_automation_serially(self):
+        """Test that COM extraction stays in this process, inside one office session."""
+        paths = ["a.xlsm", "b.docm", "c.pptm"]
+        calls = []
+
+        def extract(path, *args):
+            calls.append((path, os.getpid(), self.extractor._session_apps is not None))
+            return ExtractionResult(success=False, source_file=path)
+
+        self.extractor._select_method = lambda: "win32com"
+        self.extractor.extract = extract
+        results = self.extractor.extract_many(paths, max_workers=2)
+
+        self.assertEqual([r.source_file for r in results], paths)
+        self.assertEqual(calls, [(path, os.getpid(), True) for path in paths])
+
+    def test_sniff_format(self):
+        """Test container detection from file signatures."""
+        import zipfile
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            package = os.path.join(temp_dir, "book.xlsm")
+            with zipfile.ZipFile(package, 'w') as archive:
+                archive.writestr("[Content_Types].xml", "<Types/>")
+            compound = os.path.join(temp_dir, "book.xls")
+            Path(compound).write_bytes(VBAExtractor.OLE_MAGIC + bytes(504))
+            renamed = os.path.join(temp_dir, "notes.xlsm")
+            Path(renamed).write_text("not a workbook")
+
+            self.assertEqual(self.extractor._sniff_format(package), "ooxml")
+            self.assertFalse(self.extractor._has_vba_project_part(package))
+            self.assertEqual(self.extractor._sniff_format(compound), "ole2")
+            self.assertIsNone(self.extractor._sniff_format(renamed))
+
+    def test_extract_skips_office_for_non_office_file(self):
+        """Test that a renamed non-Office file is rejected without launching Office."""
+        launched = []
+        self.extractor._select_method = lambda: "win32com"
+        self.extractor._extract_with_win32com = launched.append
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            renamed = os.path.join(temp_dir, "report.docm")
+            Path(renamed).write_text("plain text saved with an Office extension")
+
+            result = self.extractor.extract(renamed)
+
+        self.assertFalse(result.success)
+        self.assertIn("Not an Office document", result.error_message)
+        self.assertEqual(launched, [])
+
+    def test_office_session_quits_launched_applications(self):
+        """Test that an office session quits the applications it launched once, on exit."""
+        class FakeApplication:
+            quit_count = 0
+
+            def Quit(self):
+                self.quit_count += 1
+
+        launched, borrowed = FakeApplication(), FakeApplication()
+        with self.extractor.office_session():
+            self.extractor._session_apps["Excel.Application"] = (launched, True)
+            self.extractor._session_apps["PowerPoint.Application"] = (borrowed, False)
+            with self.extractor.office_session():
+                self.assertIs(self.extractor._open_application("Excel.Application"), launched)
+            self.assertEqual(launched.quit_count, 0)
+
+        self.assertEqual(launched.quit_count, 1)
+        self.assertEqual(borrowed.quit_count, 0)
+        self.assertIsNone(self.extractor._session_apps)
+
+
+@unittest.skipUnless(OLE_DIRECT_AVAILABLE, "oletools is not installed")
+class TestVBADirectRead(unittest.TestCase):
+    """Tests for the direct VBA project read against oletools' VBA_Parser."""
+
+    def setUp(self):
+        self.extractor = VBAExtractor(ExtractionMethod.OLETOOLS)
+
+    def _parser_macros(self, source, data=None):
+        """(stream_path, vba_filename, vba_code) tuples as VBA_Parser reads them."""
+        from oletools.olevba import VBA_Parser
+
+        parser = VBA_Parser(str(source), data=data)
+        try:
+            return [macro[1:] for macro in parser.extract_macros()]
+        finally:
+            parser.close()
+
+    def test_ooxml_read_matches_vba_parser(self):
+        """Test that the direct read of a package gives VBA_Parser's macros."""
+        package = FIXTURES / 'oleform-PR314.docm'
+
+        macros, has_ole_parts = self.extractor._read_ooxml_macros(str(package))
+
+        self.assertTrue(has_ole_parts)
+        self.assertEqual(len(macros), 4)
+        self.assertEqual(macros, self._parser_macros(package))
+
+    def test_ole_read_matches_vba_parser(self):
+        """Test that the direct read of a compound file gives VBA_Parser's macros."""
+        import zipfile
+
+        with zipfile.ZipFile(FIXTURES / 'oleform-PR314.docm') as archive:
+            project = archive.read('word/vbaProject.bin')
+
+        self.assertEqual(self.extractor._read_ole_macros(project),
+                         self._parser_macros('vbaProject.bin', data=project))
+
+    def test_powerpoint_97_falls_back_to_vba_parser(self):
+        """Test that a file the direct read finds no code in still goes through VBA_Parser."""
+        presentation = FIXTURES / 'sample_with_vba.ppt'
+
+        self.assertEqual(self.extractor._read_ole_macros(str(presentation)), [])
+        result = self.extractor.extract(str(presentation))
+
+        self.assertTrue(result.success)
+        self.assertEqual([(m.name, m.code) for m in result.modules],
+                         [(name, code) for _, name, code in self._parser_macros(presentation)])
+
+    def test_ole_part_without_code(self):
+        """Test a package whose only OLE part is an embedded object without VBA."""
+        package = FIXTURES / 'embedded-simple-2007.xlsm'
+
+        self.assertEqual(self.extractor._read_ooxml_macros(str(package)), ([], True))
+        result = self.extractor.extract(str(package))
+
+        self.assertFalse(result.success)
+        self.assertEqual(result.error_message, "No VBA code found in file")
+
+    def test_malformed_project_is_logged_and_falls_back(self):
+        """Test that a direct read error is logged before falling back to VBA_Parser."""
+        import zipfile
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            package = os.path.join(temp_dir, "broken.xlsm")
+            with zipfile.ZipFile(package, 'w') as archive:
+                archive.writestr('xl/vbaProject.bin', VBAExtractor.OLE_MAGIC + bytes(4000))
+
+            with self.assertLogs('modules.vba_extractor', 'WARNING') as logs:
+                result = self.extractor.extract(package)
+
+        self.assertIn('falling back to VBA_Parser', logs.output[0])
+        self.assertFalse(result.success)
+
+
+class TestReportGenerator(unittest.TestCase):
+    """Tests for ReportGenerator module."""
+
+    def setUp(self):
+        self.generator = ReportGenerator("Test Report")
+        self.data = {
+            'statistics': {'total_files': 2, 'total_lines': 1500},
+            'files': [
+                {'name': 'main.py', 'size': 2048, 'line_count': 1200},
+                {'name': 'util.py', 'size': 100, 'line_count': 300},
+            ],
+        }
+
+    def test_generate_json(self):
+        """Test JSON output with values json cannot encode natively."""
+        import json
+        from datetime import datetime
+
+        data = dict(self.data, scanned_at=datetime(2024, 1, 15, 10, 30), root=Path('src'), tags={'py'})
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = os.path.join(tmpdir, 'report.json')
+            self.generator.generate_json(data, output_path)
+
+            with open(output_path, encoding='utf-8') as f:
+                loaded = json.load(f)
+
+        self.assertEqual(loaded['scanned_at'], '2024-01-15T10:30:00')
+        self.assertEqual(loaded['root'], 'src')
+        self.assertEqual(loaded['tags'], ['py'])
+        self.assertEqual(loaded['files'][0]['name'], 'main.py')
+
+    def test_generate_json_matches_stdlib_encoder(self):
+        """Test that the JSON bytes do not depend on whether orjson is installed."""
+        import json
+        from dataclasses import dataclass
+        from datetime import datetime
+
+        @dataclass
+        class Entry:
+            name: str
+            ratio: float
+            _private: int = 2
+
+        plain = dict(self.data, scanned_at=datetime(2024, 1, 15, 10, 30, 0, 123456),
+                     root=Path('src'), entries=[Entry('é', 0.25)], counts={1: 'one'})
+        cases = [
+            plain,
+            dict(plain, ratio=float('nan')),
+            dict(plain, limits=[float('inf'), -float('inf')]),
+            dict(plain, entries=[Entry('big', 1e16), Entry('small', 1e-7)]),
+        ]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = os.path.join(tmpdir, 'report.json')
+            for data in cases:
+                self.generator.generate_json(data, output_path)
+                expected = json.dumps(data, cls=_ReportEncoder, indent=2, ensure_ascii=False)
+                self.assertEqual(Path(output_path).read_bytes(), expected.encode('utf-8'))
+
+    def test_generate_all(self):
+        """Test that every format is written next to the base path."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = self.generator.generate_all(self.data, os.path.join(tmpdir, 'report'))
+
+            self.assertEqual([Path(p).suffix for p in paths], ['.html', '.md', '.json', '.txt'])
+            self.assertTrue(all(os.path.getsize(p) > 0 for p in paths))
+
+    def test_format_size(self):
+        """Test unit selection at the unit boundaries."""
+        self.assertEqual(_format_size(1023), '1023 B')
+        self.assertEqual(_format_size(1024), '1.0 KB')
+        self.assertEqual(_format_size(1536 * 1024), '1.5 MB')
+        self.assertEqual(_format_size(3 * 1024 ** 3), '3.0 GB')
+        self.assertEqual(_format_size(2048 * 1024 ** 4), '2048.0 TB')
+
+    def test_generate_html(self):
+        """Test HTML output escapes names and lists every file row."""
+        self.data['files'].append({'name': '<script>.py', 'size': 10, 'line_count': 1})
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = os.path.join(tmpdir, 'report.html')
+            self.generator.generate_html(self.data, output_path)
+            content = Path(output_path).read_text(encoding='utf-8')
+
+        self.assertTrue(content.startswith('<!DOCTYPE html>'))
+        self.assertTrue(content.endswith('</html>'))
+        self.assertEqual(content.count('<tr>'), 4)  # header + 3 files
+        self.assertIn('&lt;script&gt;.py', content)
+        self.assertIn('<div class="stat-value">1,500</div>', content)
+
+    def test_generate_html_without_files(self):
+        """Test that a report without files omits the table and its styles."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = os.path.join(tmpdir, 'report.html')
+            self.generator.generate_html({'statistics': self.data['statistics']}, output_path)
+            content = Path(output_path).read_text(encoding='utf-8')
+
+        self.assertNotIn('<table>', content)
+        self.assertNotIn('table{', content)
+        self.assertIn('.footer{', content)
+
+
 class TestWorkflowManager(unittest.TestCase):
     """Tests for WorkflowManager."""
 